@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for trader module.
+"""
+import logging
+import os
+import sys
+import types
+from decimal import Decimal
+
+sys.path.append(os.path.realpath(os.path.dirname(os.path.dirname(__file__))))
+from ztock.candlestick import Candlestick
+from ztock.exceptions import NoDataException
+from ztock.markets import SaxoMarket
+from ztock.symbol import Symbol
+from ztock.trader import Trader
+
+
+class AveragePriceMarket:
+    """Market stub returning a fixed order history."""
+    def __init__(self, average_price, volume):
+        self.order_history = {"average_price": average_price, "volume": volume}
+        return
+
+    def get_average_price(self, symbol, operation, days=None):
+        return self.order_history
+
+
+class SaxoChartMarket(SaxoMarket):
+    """Saxo market returning fixed candlesticks without authenticating."""
+    def __init__(self):
+        return
+
+    def get_candlesticks(self, symbol, resolution=None, intervals=None, price_type=None):
+        if (symbol.name == "EMPTY"):
+            raise NoDataException("No candlesticks")
+        return [Candlestick(10, 12, 9, 11, 100) for _ in range(intervals or 50)]
+
+
+def test_saxo_candlesticks():
+    """Checks that trader candlestick fetching works with Saxo markets."""
+    # Skip __init__, candlestick fetching only needs market, config and logger
+    trader = Trader.__new__(Trader)
+    trader.market = SaxoChartMarket()
+    trader.config = types.SimpleNamespace(candlestick_resolution=5)
+    trader.logger = logging.getLogger(__name__)
+
+    symbol_candlesticks = trader._get_candlesticks([Symbol("TEST"), Symbol("EMPTY")])
+    assert len(symbol_candlesticks["TEST"]) == 50
+    assert symbol_candlesticks["EMPTY"] is None
+    return
+
+
+def test_price_is_right():
+    """Checks price_is_right against order histories with and without volume."""
+    # Skip __init__, price_is_right only needs a market
+    trader = Trader.__new__(Trader)
+
+    # No volume, price can not be validated against average
+    trader.market = AveragePriceMarket(Decimal("10"), 0)
+    assert trader.price_is_right("TEST", "BUY", Decimal("11"))
+    assert trader.price_is_right("TEST", "SELL", Decimal("9"))
+
+    # Enough volume, price is compared to average
+    trader.market = AveragePriceMarket(Decimal("10"), Decimal("100"))
+    assert not trader.price_is_right("TEST", "BUY", Decimal("11"))
+    assert trader.price_is_right("TEST", "BUY", Decimal("9"))
+    assert not trader.price_is_right("TEST", "SELL", Decimal("9"))
+    assert trader.price_is_right("TEST", "SELL", Decimal("11"))
+    return
+
+
+def main():
+    """Runs trader checks."""
+    test_price_is_right()
+    test_saxo_candlesticks()
+    print("OK")
+    return
+
+
+if (__name__ == "__main__"):
+    main()
@@ -3,14 +3,14 @@ import datetime
 import json
 import logging
 import uuid
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from . import patterns
 from .config import Config
 from .constants import LOG_NAME
 from .exceptions import NoDataException
 from .markets import Market
-from .patterns.candlestick import CandlestickPattern
+from .patterns import PatternResult
 from .symbol import Symbol
 
 
@@ -83,19 +83,20 @@ class Analyzer:
             self.logger.debug("{} {} - Analyzing {} symbol {}".format(
                 self.market.name, self.id, exchange, symbol.name
             ))
-            patterns = self.analyze_symbol(symbol)
-            if (patterns is None):
+            analysis = self.analyze_symbol(symbol)
+            if (analysis is None):
                 continue
+            patterns, latest_timestamp = analysis
 
-            score = sum([pattern.indication for pattern in patterns])
+            score = sum(pattern.indication for pattern in patterns)
             # Print recognized strong positive patterns
             if (score > 100.0 or any(pattern.indication > 100.0 for pattern in patterns)):
                 self.log_new_patterns(symbol, exchange, score, patterns)
 
             # Convert timestamp to string if defined
             timestamp = None
-            if (patterns[-1].timestamp is not None):
-                timestamp = patterns[-1].timestamp.strftime("%Y.%m.%d %H:%M:%S")
+            if (latest_timestamp is not None):
+                timestamp = latest_timestamp.strftime("%Y.%m.%d %H:%M:%S")
 
             results[symbol_name] = {
                 "patterns": {
@@ -110,7 +111,13 @@ class Analyzer:
             }
         return results
 
-    def analyze_symbol(self, symbol: Symbol) -> List[CandlestickPattern]:
+    def analyze_symbol(
+            self, symbol: Symbol
+    ) -> Optional[Tuple[List[PatternResult], Optional[datetime.datetime]]]:
+        """
+        Analyzes symbol candlesticks for patterns. Returns pattern results
+        along with latest candlestick timestamp, or None if skipped.
+        """
         # Get candlesticks
         try:
             candles = self.market.get_candlesticks(symbol, self.config.candlestick_resolution)
@@ -139,7 +146,7 @@ class Analyzer:
 
         # Analyze candlesticks for trends
         results = patterns.analyze_candlesticks(candles)
-        return results
+        return results, candles[-1].timestamp
 
     def validate_candle_age(self, timestamp: datetime.datetime):
         """Validates candlestick age. Returns True if valid or False if too old for analysis."""
@@ -170,7 +177,7 @@ class Analyzer:
             symbol: str,
             exchange_code: str,
             score: float,
-            results: List[CandlestickPattern]
+            results: List[PatternResult]
     ) -> None:
         """Logs newly recognized patterns along with total symbol indication score."""
         recognized_patterns = [pattern for pattern in results if pattern.indication != 0.0]
@@ -185,7 +192,7 @@ class Analyzer:
         )
         return
 
-    def generate_pattern_strings(self, patterns: List[CandlestickPattern]) -> List[str]:
+    def generate_pattern_strings(self, patterns: List[PatternResult]) -> List[str]:
         """Returns list of pattern display strings."""
         pattern_strings = [
             f"{pattern.name} [{pattern.indication}]"
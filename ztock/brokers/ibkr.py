@@ -9,7 +9,6 @@ Installation: https://interactivebrokers.github.io/cpwebapi/
 API doc: https://ndcdyn.interactivebrokers.com/api/doc.html
 """
 import datetime
-import logging
 import urllib3
 from decimal import Decimal
 from typing import Any, Dict, List, Optional, Union
@@ -19,7 +18,6 @@ from .message import Message
 from .order import Order
 from .position import Position
 from ..config import Config
-from ..constants import LOG_NAME
 from ..symbol import Symbol
 from ..utils import parse_decimal
 
@@ -32,7 +30,6 @@ class IBKR(Broker):
     currency = None
     minimum_order_fee = 1
     timeout = 120
-    retry_on_status_codes = [500]
 
     version = "v1"
     order_type_remap = {
@@ -56,17 +53,15 @@ class IBKR(Broker):
         :param config: broker config
         :type config: Config
         """
-        self.config = config
+        super().__init__(config)
         self.account_id = config.account_id
         gateway_url = getattr(config, "gateway_url", "localhost")
         gateway_port = getattr(config, "gateway_port", 5000)
         self.root_url = f"https://{gateway_url}:{gateway_port}/{self.version}/api"
 
-        # Init logger
-        self.logger = logging.getLogger(LOG_NAME)
-
-        # Disable localhost SSL warning
+        # Disable localhost SSL warning and verification
         urllib3.disable_warnings()
+        self.session.verify = False
 
         # Query accounts and info
         self.accounts = self.get_accounts()
@@ -426,8 +421,11 @@ class IBKR(Broker):
         ]
         order = Order(contract_id, messages=messages)
 
-        for i, message in reversed(list(enumerate(messages))):
+        # Reply to known messages, latest first, keeping unhandled messages
+        unhandled = []
+        for message in reversed(messages):
             if (not message.content):
+                unhandled.append(message)
                 continue
 
             # If IB warning about missing market data, confirm order
@@ -439,7 +437,6 @@ class IBKR(Broker):
                     for content in message.content
             )):
                 self._send_order_reply(message, True)
-                messages.pop(i)
                 continue
 
             # Confirm market order cap price
@@ -448,8 +445,10 @@ class IBKR(Broker):
                     for content in message.content
             )):
                 self._send_order_reply(message, True)
-                messages.pop(i)
                 continue
+            unhandled.append(message)
+        # Order holds the same list, update it in place
+        messages[:] = reversed(unhandled)
 
         # Log any unhandled messages
         if (messages):
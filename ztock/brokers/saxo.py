@@ -28,7 +28,6 @@ class SaxoBroker(SaxoClient):
     currency = None
     minimum_order_fee = 7
     timeout = 60
-    retry_on_status_codes = []
 
     order_type_remap = {
         "market": "Market",
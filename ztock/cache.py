@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+In-memory caching helpers.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache where entries also expire after a given number of
+    seconds. Least recently used entries are evicted when maxsize is reached.
+    """
+    def __init__(self, maxsize: int = 4096, ttl: float = 3600) -> None:
+        """
+        Inits empty cache.
+
+        :param maxsize: max number of entries, defaults to 4096
+        :type maxsize: int
+        :param ttl: seconds before an entry expires, defaults to 3600
+        :type ttl: float
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        return
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Returns cached value for key, or default if missing or expired.
+
+        :param key: cache key
+        :type key: hashable
+        :param default: value returned on cache miss
+        :type default: any
+        :return: cached value
+        :rtype: any
+        """
+        with self._lock:
+            entry = self._entries.get(key, None)
+            if (entry is None):
+                return default
+            timestamp, value = entry
+            if (time.monotonic() - timestamp >= self.ttl):
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Stores value for key, evicting the least recently used entry if full.
+
+        :param key: cache key
+        :type key: hashable
+        :param value: value to cache
+        :type value: any
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while (len(self._entries) > self.maxsize):
+                self._entries.popitem(last=False)
+        return
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Removes key from cache, returns its value or default if missing."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        if (entry is None):
+            return default
+        return entry[1]
+
+    def clear(self) -> None:
+        """Removes all cached entries."""
+        with self._lock:
+            self._entries.clear()
+        return
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._entries.get(key, None)
+        return (entry is not None and time.monotonic() - entry[0] < self.ttl)
+
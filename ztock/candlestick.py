@@ -4,7 +4,9 @@ Handles candlestick objects with functionality for TA-Lib pattern recognition.
 """
 import datetime
 from decimal import Decimal
-from typing import Optional, Union
+from typing import Dict, Iterable, Optional, Union
+
+import numpy as np
 
 from .utils import parse_decimal
 
@@ -57,3 +59,110 @@ class Candlestick:
     def __str__(self) -> str:
         """See __repr__"""
         return self.__repr__()
+
+
+class CandlestickSeries:
+    """
+    Candlestick values stored as one numpy array per field. Used for pattern
+    recognition on open, high, low, close and volume values.
+
+    Values are stored as float32, which is ample precision for prices and
+    halves memory use. TA-Lib takes float64, so callers cast the (short)
+    windows they pass on.
+    """
+    fields = ("open", "high", "low", "close", "volume")
+    dtype = np.float32
+
+    def __init__(self, capacity: int = 64) -> None:
+        """
+        Inits empty candlestick series.
+
+        :param capacity: initial number of candlesticks to allocate for
+        :type capacity: int
+        """
+        self._size = 0
+        self._arrays = {
+            field: np.empty(max(capacity, 1), dtype=self.dtype)
+            for field in self.fields
+        }
+        self.timestamp = []
+        return
+
+    @classmethod
+    def from_candlesticks(cls, candlesticks: Iterable[Candlestick]) -> "CandlestickSeries":
+        """
+        Creates series from candlestick objects.
+
+        :param candlesticks: candlesticks, oldest first
+        :type candlesticks: list of ztock.Candlestick
+        :return: candlestick series
+        :rtype: ztock.candlestick.CandlestickSeries
+        """
+        candlesticks = list(candlesticks)
+        series = cls(len(candlesticks))
+        for candle in candlesticks:
+            series.append(
+                candle.open, candle.high, candle.low, candle.close, candle.volume,
+                candle.timestamp
+            )
+        return series
+
+    def append(
+            self,
+            open_: Union[float, Decimal],
+            high: Union[float, Decimal],
+            low: Union[float, Decimal],
+            close: Union[float, Decimal],
+            volume: Optional[Union[float, Decimal]] = None,
+            timestamp: Optional[datetime.datetime] = None
+    ) -> None:
+        """
+        Appends candlestick values to series, growing the arrays when full.
+        Missing volume is stored as NaN.
+        """
+        if (self._size == len(self._arrays["open"])):
+            self._grow()
+        i = self._size
+        self._arrays["open"][i] = open_
+        self._arrays["high"][i] = high
+        self._arrays["low"][i] = low
+        self._arrays["close"][i] = close
+        self._arrays["volume"][i] = volume if (volume is not None) else np.nan
+        self.timestamp.append(timestamp)
+        self._size += 1
+        return
+
+    def _grow(self) -> None:
+        """Doubles array capacity, keeping current values."""
+        for field, array in self._arrays.items():
+            grown = np.empty(len(array) * 2, dtype=array.dtype)
+            grown[:self._size] = array[:self._size]
+            self._arrays[field] = grown
+        return
+
+    @property
+    def open(self) -> np.ndarray:
+        return self._arrays["open"][:self._size]
+
+    @property
+    def high(self) -> np.ndarray:
+        return self._arrays["high"][:self._size]
+
+    @property
+    def low(self) -> np.ndarray:
+        return self._arrays["low"][:self._size]
+
+    @property
+    def close(self) -> np.ndarray:
+        return self._arrays["close"][:self._size]
+
+    @property
+    def volume(self) -> np.ndarray:
+        return self._arrays["volume"][:self._size]
+
+    def as_inputs(self) -> Dict[str, np.ndarray]:
+        """Returns TA-Lib input dict of array views, without copying."""
+        return {field: self._arrays[field][:self._size] for field in self.fields}
+
+    def __len__(self) -> int:
+        return self._size
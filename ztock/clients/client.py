@@ -4,11 +4,13 @@ Base Client class. Can be any entity communicating with market data vendors
 or brokers.
 """
 import logging
-import time
 from typing import Any, Dict, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from ..cache import TTLCache
 from ..config import Config
 from ..constants import LOG_NAME
 
@@ -16,8 +18,13 @@ from ..constants import LOG_NAME
 class Client:
     name = "Client"
     timeout = 60
-    retry_on_status_codes = []
     session = requests
+    # Connection pool sizes for the client requests session
+    pool_connections = 50
+    pool_maxsize = 100
+    # Symbol lookup cache size and seconds before cached lookups expire
+    lookup_cache_size = 4096
+    lookup_ttl = 3600
 
     """Base Client class. Should be subclassed into Market or Broker instances."""
     def __init__(self, config: Config) -> None:
@@ -31,8 +38,40 @@ class Client:
 
         # Init logger
         self.logger = logging.getLogger(LOG_NAME)
+
+        # Start pooled requests session
+        self.session = self.create_session()
+
+        # Caches for symbol lookups and failed lookups, keyed by (symbol name, contract type)
+        self._symbol_lookup_cache = TTLCache(self.lookup_cache_size, self.lookup_ttl)
+        self._missing_lookup_cache = TTLCache(self.lookup_cache_size, self.lookup_ttl)
         return
 
+    def create_session(self) -> requests.Session:
+        """
+        Returns a requests session with a connection pool, keeping
+        connections to the vendor alive between requests.
+
+        Connection errors and rate limit/server error status codes are
+        retried with exponential backoff, honoring Retry-After headers. Only
+        idempotent methods are retried on status codes, POST is left out so
+        orders are never placed twice.
+
+        :return: requests session
+        :rtype: requests.Session
+        """
+        retry = Retry(
+            total=5, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True, raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize,
+            max_retries=retry
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        return session
+
     def authenticate(self):
         """Authenticates with vendor."""
         raise NotImplementedError("Client.authenticate() not implemented")
@@ -50,11 +89,13 @@ class Client:
             data: Dict[str, Any] = None,
             json: Dict[str, Any] = None,
             auth: Tuple[str] = None,
-            retries: int = None
+            *,
+            stream: bool = False,
+            prepared: requests.PreparedRequest = None
     ) -> requests.Response:
         """
         Sends requests HTTP request with specified operation, url, headers and
-        data, along with retry handling on specific errors.
+        data. Retries are handled by the session, see create_session().
 
         :param operation: HTTP request type: GET, POST or DELETE
         :type operation: str
@@ -70,31 +111,38 @@ class Client:
         :type json: dict of (str, any)
         :param auth: requests Basic authentication tuple of (username, password)
         :type auth: tuple of str
-        :param retries: number of retries on errors, defaults to 2
-        :type retries: int
+        :param stream: flag for not downloading response body until accessed,
+            defaults to False
+        :type stream: bool
+        :param prepared: optional prepared request to send as is, instead of
+            building one from operation, url and payload
+        :type prepared: requests.PreparedRequest
         :return: requests response object
         :rtype: requests.Response
         """
         session = session or getattr(self, "session", requests)
-        sleep_duration = 5
 
-        if (operation == "GET"):
+        if (prepared is not None):
+            # Session.send skips environment proxy and CA bundle settings, merge them in
+            settings = session.merge_environment_settings(prepared.url, {}, stream, False, None)
+            response = session.send(prepared, timeout=self.timeout, **settings)
+        elif (operation == "GET"):
             response = session.get(
                 url, params=data, headers=headers, auth=auth,
-                timeout=self.timeout, verify=False
+                timeout=self.timeout, verify=False, stream=stream
             )
         elif (operation == "POST"):
             response = session.post(
                 url, data=data, json=json, headers=headers, auth=auth,
-                timeout=self.timeout, verify=False
+                timeout=self.timeout, verify=False, stream=stream
             )
         elif (operation == "DELETE"):
             response = session.delete(
                 url, headers=headers, auth=auth,
-                timeout=self.timeout, verify=False
+                timeout=self.timeout, verify=False, stream=stream
             )
 
-        # Check response status, retry on defined status codes
+        # Check response status
         try:
             response.raise_for_status()
         except requests.HTTPError:
@@ -110,19 +158,5 @@ class Client:
             self.logger.debug("HTTPError response status code {}: {}".format(
                 response.status_code, response.reason
             ))
-
-            if (retries and response.status_code in self.retry_on_status_codes):
-                self.logger.debug(
-                    "Client: HTTP status code {} on {} {}, headers: {}, data: {}. "
-                    "Retrying in {} seconds..".format(
-                        response.status_code, operation, url, headers, data, sleep_duration
-                    )
-                )
-                time.sleep(sleep_duration)
-                return self.request(
-                    operation=operation, url=url, session=session,
-                    headers=headers, data=data, json=json, auth=auth,
-                    retries=retries - 1
-                )
             raise
         return response
@@ -6,21 +6,21 @@ authentication database.
 https://www.developer.saxo
 """
 import datetime
-import logging
+import functools
+import threading
 import time
 import urllib3
 from typing import Any, Dict, Optional, Tuple, Union
 from urllib.parse import parse_qs, urlparse
 
-import pytz
 import requests
 
 from .client import Client
+from ..cache import TTLCache
 from ..config import Config
-from ..constants import LOG_NAME
-from ..databases import SaxoDB
+from ..databases import CacheDB, SaxoDB
 from ..exceptions import AuthenticationExpiredError
-from ..exchange import Exchange
+from ..exchange import get_exchange
 from ..symbol import Symbol
 from ..utils import generate_random_string
 
@@ -54,7 +54,8 @@ class SaxoClient(Client):
         "my_orders": "https://gateway.saxobank.com/openapi/port/v1/orders/me",
     }
     _token = None
-    _instruments = {}
+    # Max number of cached prepared requests
+    prepared_cache_size = 256
 
     def __init__(self, config: Config) -> None:
         """
@@ -74,10 +75,10 @@ class SaxoClient(Client):
         :param config: market config
         :type config: Config
         """
-        # Store config
-        self.config = config
-        # Init SQLite database for access tokens
+        super().__init__(config)
+        # Init SQLite databases for access tokens and cached vendor data
         self._db = SaxoDB()
+        self._cache_db = CacheDB()
         # Disable SSL warnings
         urllib3.disable_warnings()
 
@@ -86,6 +87,8 @@ class SaxoClient(Client):
         self.app_secret = config.app_secret
         self.redirect_uri = config.redirect_uri
         self.sim_mode = getattr(config, "sim_mode", False)
+        # Keeps persistent cache entries apart for SIM and live environments
+        self._cache_prefix = "saxo:sim:" if (self.sim_mode) else "saxo:live:"
 
         # Define URLs
         if (self.sim_mode):
@@ -97,11 +100,11 @@ class SaxoClient(Client):
             self.token_url = "https://live.logonvalidation.net/token"
             self.auth_url = "https://live.logonvalidation.net/authorize"
 
-        # Get logger
-        self.logger = logging.getLogger(LOG_NAME)
-
-        # Start requests session
-        self.session = requests.Session()
+        # Serializes token validation/refresh when requests are sent from threads
+        self._auth_lock = threading.RLock()
+        # Reusable prepared requests, cleared when the access token changes.
+        # The current auth header is applied to a copy on every send
+        self._prepared_requests = TTLCache(self.prepared_cache_size, self.lookup_ttl)
 
         # Authenticate
         self.authenticate(error_on_reauth=False)
@@ -117,23 +120,24 @@ class SaxoClient(Client):
             Defaults to True
         :type error_on_reauth: bool
         """
-        # Get token from database, if not in memory
-        if (self._token is None):
-            self._token = self._db.get_token()
-            self._set_access_token_header()
-        # Validate access/refresh token if stored. Init authentication flow if expired/missing
-        if (self._token):
-            if (self._validate_tokens()):
+        with self._auth_lock:
+            # Get token from database, if not in memory
+            if (self._token is None):
+                self._token = self._db.get_token()
+                self._set_access_token_header()
+            # Validate access/refresh token if stored. Init authentication flow if expired/missing
+            if (self._token):
+                if (self._validate_tokens()):
+                    return
+
+            try:
+                self._token = self._authenticate_oauth2()
+            except AuthenticationExpiredError:
+                if (error_on_reauth):
+                    raise
+                self.logger.warning("{} - Authorization required".format(self.name))
                 return
 
-        try:
-            self._token = self._authenticate_oauth2()
-        except AuthenticationExpiredError:
-            if (error_on_reauth):
-                raise
-            self.logger.warning("{} - Authorization required".format(self.name))
-            return
-
         return
 
     def refresh(self) -> None:
@@ -153,8 +157,17 @@ class SaxoClient(Client):
         :rtype: ztock.broker.Symbol
         """
         # Check if previously returned
-        if (symbol_name in self._instruments):
-            return self._instruments[symbol_name]
+        cache_key = (symbol_name, None)
+        symbol = self._symbol_lookup_cache.get(cache_key)
+        if (symbol is not None):
+            return symbol
+        # Check persistent cache from previous sessions
+        disk_key = f"{self._cache_prefix}lookup:{symbol_name}"
+        cached = self._cache_db.get(disk_key, self.lookup_ttl)
+        if (cached is not None):
+            symbol = cached[1]
+            self._symbol_lookup_cache.set(cache_key, symbol)
+            return symbol
         # Define URL
         url = f"{self.root_url}/ref/v1/instruments"
         # Generate and send request with payload
@@ -165,20 +178,26 @@ class SaxoClient(Client):
         # Unpack result and create Symbol to return
         symbol_infos = response.json()
         symbol = self._unpack_symbol(symbol_infos["Data"][0])
-        self._instruments[symbol_name] = symbol
+        self._symbol_lookup_cache.set(cache_key, symbol)
+        self._cache_db.set(disk_key, symbol)
         return symbol
 
-    def _unpack_symbol(self, symbol_dict: Dict[str, Any]) -> None:
+    def _unpack_symbol(self, symbol_dict: Dict[str, Any]) -> Symbol:
         """Unpacks API response symbol info dict to Symbol instance."""
+        symbol_name, fields = self._unpack_symbol_fields(symbol_dict)
+        symbol = Symbol(symbol_name, **fields)
+        return symbol
+
+    def _unpack_symbol_fields(self, symbol_dict: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        """Unpacks API response symbol info dict to symbol name and Symbol keyword fields."""
         symbol_name = symbol_dict["Symbol"].split(":")[0]
-        symbol = Symbol(
-            symbol_name,
-            display_symbol=symbol_dict["Symbol"],
-            currency=symbol_dict.get("CurrencyCode", None),
-            exchange=symbol_dict.get("ExchangeId", None),
+        fields = {
+            "display_symbol": symbol_dict["Symbol"],
+            "currency": symbol_dict.get("CurrencyCode", None),
+            "exchange": symbol_dict.get("ExchangeId", None),
             **symbol_dict
-        )
-        return symbol
+        }
+        return symbol_name, fields
 
     def request(
             self,
@@ -189,26 +208,36 @@ class SaxoClient(Client):
             data: Dict[str, Any] = None,
             json: Dict[str, Any] = None,
             auth: Tuple[str] = None,
-            retries: int = None,
-            authenticate: bool = True
+            authenticate: bool = True,
+            *,
+            stream: bool = False,
+            prepared: requests.PreparedRequest = None
     ) -> requests.Response:
-        """Extends base request with exception handling for stale token or reauthentication."""
+        """
+        Extends base request with exception handling for stale token or
+        reauthentication. Retries rebuild the request instead of resending a
+        prepared request, so refreshed auth headers are used.
+        """
         # Validate tokens, and reauthenticate if necessary
         if (authenticate):
             self.authenticate()
+        if (prepared is not None):
+            prepared = self._with_access_token_header(prepared)
         try:
             # Pass on request to super
             response = super().request(
                 operation=operation, url=url, session=session, headers=headers,
-                data=data, json=json, auth=auth, retries=retries
+                data=data, json=json, auth=auth, stream=stream,
+                prepared=prepared
             )
 
-            # If rate limit error, wait for two minutes and retry
-            if (self._request_has_rate_limit_error(response)):
+            # If rate limit error, wait for two minutes and retry. Streamed
+            # bodies are left unread for the caller
+            if (not stream and self._request_has_rate_limit_error(response)):
                 time.sleep(120)
                 return super().request(
                     operation=operation, url=url, session=session, headers=headers,
-                    data=data, json=json, auth=auth, retries=retries
+                    data=data, json=json, auth=auth, stream=stream
                 )
 
         # Exception handling
@@ -225,7 +254,7 @@ class SaxoClient(Client):
                 self.authenticate()
                 return super().request(
                     operation=operation, url=url, session=session, headers=headers,
-                    data=data, json=json, auth=auth, retries=retries
+                    data=data, json=json, auth=auth, stream=stream
                 )
 
             # If rate limit error, wait for two minutes and retry
@@ -236,7 +265,7 @@ class SaxoClient(Client):
                 time.sleep(120)
                 return super().request(
                     operation=operation, url=url, session=session, headers=headers,
-                    data=data, json=json, auth=auth, retries=retries
+                    data=data, json=json, auth=auth, stream=stream
                 )
 
             raise
@@ -265,7 +294,7 @@ class SaxoClient(Client):
         results = response.json()
         exchanges = {}
         for exchange_info in results["Data"]:
-            exchange = Exchange(
+            exchange = get_exchange(
                 code=exchange_info["ExchangeId"],
                 currency=exchange_info["Currency"],
                 country=exchange_info["CountryCode"]
@@ -409,10 +438,34 @@ class SaxoClient(Client):
         self.session.headers.update({
             header: value,
         })
+        # Prepared requests hold the previous header, drop them
+        self._prepared_requests.clear()
         return
 
-    def _parse_utc_datestring(self, datestring: str):
+    def _with_access_token_header(
+            self, prepared: requests.PreparedRequest
+    ) -> requests.PreparedRequest:
+        """Returns copy of prepared request with the current access token header."""
+        prepared = prepared.copy()
+        with self._auth_lock:
+            authorization = self.session.headers.get("Authorization", None)
+        if (authorization is not None):
+            prepared.headers["Authorization"] = authorization
+        return prepared
+
+    def _parse_utc_datestring(self, datestring: str) -> datetime.datetime:
         """Parses UTC datestrings returned by Saxo Bank's OpenAPI."""
-        timestamp = datetime.datetime.strptime(datestring, "%Y-%m-%dT%H:%M:%S.%fZ")
-        timestamp.replace(tzinfo=pytz.utc)
-        return timestamp
+        return _parse_utc_iso(datestring)
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_utc_iso(datestring: str) -> datetime.datetime:
+    """
+    Parses ISO 8601 UTC datestring with trailing Z to naive UTC datetime.
+    Cached, since candlestick timestamps repeat across symbols.
+    """
+    try:
+        return datetime.datetime.fromisoformat(datestring.rstrip("Z"))
+    except ValueError:
+        # Older Pythons only parse 3 or 6 fractional digits
+        return datetime.datetime.strptime(datestring, "%Y-%m-%dT%H:%M:%S.%fZ")
@@ -2,11 +2,13 @@
 """
 Handles SQLite database operations.
 """
+from .cache import CacheDB
 from .database import Database, Field
 from .saxo import SaxoDB
 
 
 __all__ = [
+    "CacheDB",
     "Database",
     "Field",
     "SaxoDB",
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+Persistent key-value cache storage, for keeping slow-changing vendor data
+such as symbol lists between python script sessions.
+"""
+import pickle
+import threading
+import time
+from typing import Any, Optional, Tuple
+
+from .database import Database, Field
+
+
+SCHEMA = [
+    Field("key", "TEXT", nullable=False, primary_key=True),
+    Field("value", "BLOB"),
+    Field("timestamp", "REAL"),
+]
+
+
+class CacheDB(Database):
+    """
+    Handles database storage of pickled cache values by string key. Can be
+    used from multiple threads.
+    """
+    check_same_thread = False
+
+    def __init__(self) -> None:
+        """Inits cache database with default name."""
+        name = "cache"
+        super().__init__(name)
+        self._lock = threading.Lock()
+
+        # Create cache table if it does not exist
+        self.cache_table_name = "cache"
+        if (self.cache_table_name.upper() not in [table.upper() for table in self.tables]):
+            self.logger.debug("CacheDB - Cache database table does not exist, creating table")
+            self.create_table(self.cache_table_name, SCHEMA)
+        return
+
+    def get(self, key: str, max_age: Optional[float] = None) -> Optional[Tuple[float, Any]]:
+        """
+        Returns cached value for key along with its age in seconds, or None
+        if missing or older than max_age.
+
+        :param key: cache key
+        :type key: str
+        :param max_age: optional max age in seconds
+        :type max_age: float
+        :return: tuple of (age, value)
+        :rtype: tuple of (float, any)
+        """
+        sql = f"SELECT value, timestamp FROM {self.cache_table_name} WHERE key = ?;"
+        with self._lock:
+            row = self.conn.execute(sql, (key,)).fetchone()
+        if (row is None):
+            return None
+        value, timestamp = row
+        age = time.time() - timestamp
+        if (max_age is not None and age >= max_age):
+            return None
+        try:
+            return age, pickle.loads(value)
+        except Exception:
+            self.logger.warning("CacheDB - Unable to unpickle cached value for key: {}".format(key))
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Stores pickled value for key, replacing any existing value.
+
+        :param key: cache key
+        :type key: str
+        :param value: value to cache, must be picklable
+        :type value: any
+        """
+        sql = (
+            f"INSERT OR REPLACE INTO {self.cache_table_name} (key, value, timestamp) "
+            "VALUES (?, ?, ?);"
+        )
+        row = (key, pickle.dumps(value, pickle.HIGHEST_PROTOCOL), time.time())
+        with self._lock:
+            self.conn.execute(sql, row)
+            self.conn.commit()
+        return
+
+    def delete(self, key_prefix: str) -> None:
+        """Deletes cached values with keys starting with prefix."""
+        sql = f"DELETE FROM {self.cache_table_name} WHERE substr(key, 1, ?) = ?;"
+        with self._lock:
+            self.conn.execute(sql, (len(key_prefix), key_prefix))
+            self.conn.commit()
+        return
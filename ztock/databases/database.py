@@ -13,6 +13,9 @@ from ..constants import DB_FOLDER, LOG_NAME
 
 class Database:
     """Base Database class."""
+    # Set to False in subclasses that serialize connection use between threads
+    check_same_thread = True
+
     def __init__(self, db_name: str) -> None:
         """
         Inits Database object with given database name. Creates the database
@@ -34,7 +37,9 @@ class Database:
         self.name = db_name
         self.file_name = f"{self.name}.sqlite3"
         self.path = os.path.join(DB_FOLDER, self.file_name)
-        self.conn = sqlite3.connect(self.path)  # pylint: disable=no-member
+        self.conn = sqlite3.connect(  # pylint: disable=no-member
+            self.path, check_same_thread=self.check_same_thread
+        )
 
         # Get list of tables
         self.tables = [row[0] for row in self.select("sqlite_master", ["name"], "type = 'table'")]
@@ -3,6 +3,7 @@
 Saxo Bank authentication storage.
 """
 import datetime
+import threading
 from typing import Dict, Union
 
 from .database import Database, Field
@@ -22,12 +23,17 @@ SCHEMA = [
 class SaxoDB(Database):
     """
     Handles database storage of Saxo Bank client access tokens for
-    authentication between python script sessions.
+    authentication between python script sessions. Can be used from
+    multiple threads, e.g. when tokens are refreshed during concurrent
+    requests.
     """
+    check_same_thread = False
+
     def __init__(self) -> None:
         """Inits Saxo Bank token database with default name."""
         name = "saxo"
         super().__init__(name)
+        self._lock = threading.Lock()
         self.field_names = [field.name for field in SCHEMA]
         self.date_fields = ["timestamp"]
 
@@ -40,7 +46,8 @@ class SaxoDB(Database):
 
     def get_token(self) -> Dict[str, Union[str, int, datetime.datetime]]:
         """Fetches Saxo token dict from SQLite database."""
-        token_rows = [row for row in self.select(self.token_table_name, self.field_names)]
+        with self._lock:
+            token_rows = [row for row in self.select(self.token_table_name, self.field_names)]
         if (len(token_rows) == 0):
             return {}
         token = {field.name: token_rows[0][i] for i, field in enumerate(SCHEMA)}
@@ -53,6 +60,7 @@ class SaxoDB(Database):
     def store_token(self, token: Dict[str, Union[str, int, datetime.datetime]]) -> None:
         """Stores Saxo token dict in SQLite database."""
         token_row = [token.get(field, None) for field in self.field_names]
-        self.truncate(self.token_table_name)
-        self.insert(self.token_table_name, self.field_names, [token_row])
+        with self._lock:
+            self.truncate(self.token_table_name)
+            self.insert(self.token_table_name, self.field_names, [token_row])
         return
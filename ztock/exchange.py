@@ -3,33 +3,41 @@
 Exchange class for handling opening hours, exchange code remaps etc.
 """
 import datetime
+import functools
+import types
 from typing import Optional
 
-from pytz import timezone
-
 from .exceptions import UnknownExchange
 
 
-# Exchange opening hours in UTC, formatted as dicts with open, close and weekdays
-OPENING_HOURS = {
-    "NASDAQ": {
-        "open": datetime.time(9, 30, 0, tzinfo=timezone("US/Eastern")),
-        "close": datetime.time(16, 0, 0, tzinfo=timezone("US/Eastern")),
-        "weekdays": [0, 1, 2, 3, 4],
-    },
-    "NYSE": {
-        "open": datetime.time(9, 30, 0, tzinfo=timezone("US/Eastern")),
-        "close": datetime.time(16, 0, 0, tzinfo=timezone("US/Eastern")),
-        "weekdays": [0, 1, 2, 3, 4],
-    },
-    "OSE": {
-        "open": datetime.time(7, 0, 0, tzinfo=timezone("Europe/Oslo")),
-        "close": datetime.time(14, 20, 0, tzinfo=timezone("Europe/Oslo")),
-        "weekdays": [0, 1, 2, 3, 4],
-    },
-}
-# Exchange aliases
-OPENING_HOURS["US"] = OPENING_HOURS["NASDAQ"]
+# Exchange opening hours in local exchange time, formatted as dicts with open,
+# close, timezone name and weekdays
+_US_OPENING_HOURS = types.MappingProxyType({
+    "open": datetime.time(9, 30, 0),
+    "close": datetime.time(16, 0, 0),
+    "timezone": "US/Eastern",
+    "weekdays": (0, 1, 2, 3, 4),
+})
+OPENING_HOURS = types.MappingProxyType({
+    "NASDAQ": _US_OPENING_HOURS,
+    "NYSE": _US_OPENING_HOURS,
+    "OSE": types.MappingProxyType({
+        "open": datetime.time(7, 0, 0),
+        "close": datetime.time(14, 20, 0),
+        "timezone": "Europe/Oslo",
+        "weekdays": (0, 1, 2, 3, 4),
+    }),
+    # Exchange aliases
+    "US": _US_OPENING_HOURS,
+})
+
+
+@functools.lru_cache(maxsize=None)
+def _tz(name: str) -> datetime.tzinfo:
+    """Returns pytz timezone by name. Imports pytz on first use, since
+    loading timezones reads zoneinfo files from disk."""
+    from pytz import timezone
+    return timezone(name)
 
 
 class Exchange:
@@ -63,12 +71,33 @@ class Exchange:
         """Returns flag for if exchange is open for trading or not."""
         if (self.opening_hours is None):
             raise UnknownExchange("Unknown opening hours for exchange: {}".format(self.code))
-        now = datetime.datetime.now(tz=self.opening_hours["open"].tzinfo)
+        now = datetime.datetime.now(tz=_tz(self.opening_hours["timezone"]))
         # Check weekday
         weekday = now.weekday()
         if (weekday not in self.opening_hours["weekdays"]):
             return False
         # Check time
-        if (self.opening_hours["open"] <= now.timetz() < self.opening_hours["close"]):
+        if (self.opening_hours["open"] <= now.time() < self.opening_hours["close"]):
             return True
         return False
+
+
+@functools.lru_cache(maxsize=None)
+def get_exchange(
+        code: str, currency: Optional[str] = None, country: Optional[str] = None
+) -> Exchange:
+    """
+    Returns shared Exchange instance for given exchange code, currency and
+    country. Exchange objects are read-only after init, so one instance is
+    reused per process.
+
+    :param code: exchange code
+    :type code: str
+    :param currency: optional exchange currency
+    :type currency: str
+    :param country: two-letter country code
+    :type country: str
+    :return: exchange object
+    :rtype: ztock.exchange.Exchange
+    """
+    return Exchange(code, currency, country)
@@ -8,7 +8,7 @@ Also handles console output.
 """
 import datetime
 import logging
-import smtplib
+from email.message import EmailMessage
 from logging.handlers import TimedRotatingFileHandler
 from typing import List, Union
 
@@ -96,6 +96,9 @@ class BufferingSMTPHandler(logging.handlers.BufferingHandler):
                 hours_since_last_mail
             ))
 
+        # Imported here to skip loading SMTP/TLS modules when mail is not configured
+        import smtplib
+
         try:
             # Connect to SMTP server
             server = smtplib.SMTP(self.mailhost, self.mailport)
@@ -103,21 +106,14 @@ class BufferingSMTPHandler(logging.handlers.BufferingHandler):
             server.starttls()
             server.ehlo()
             server.login(self.username, self.password)
-            # Create body
-            body = ""
-            for record in self.buffer:
-                text = self.format(record)
-                body += text + "\r\n"
             # Create message
-            msg = "\r\n".join([
-                f"From: {self.fromaddr}",
-                f"To: {','.join(self.toaddrs)}",
-                f"Subject: {self.subject}",
-                "",
-                f"{body}",
-            ])
+            msg = EmailMessage()
+            msg["From"] = self.fromaddr
+            msg["To"] = ", ".join(self.toaddrs)
+            msg["Subject"] = self.subject
+            msg.set_content("\r\n".join(self.format(record) for record in self.buffer))
             # Send mail
-            server.sendmail(self.fromaddr, self.toaddrs, msg)
+            server.send_message(msg)
             self._last_mail = datetime.datetime.now()
             self._errors_logged = False
             server.quit()
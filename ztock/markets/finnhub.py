@@ -8,6 +8,7 @@ import datetime
 import logging
 import math
 import time
+import types
 import urllib3
 from decimal import Decimal
 from typing import Dict, List, Optional, Union
@@ -17,7 +18,6 @@ import requests
 from .market import Market
 from ..candlestick import Candlestick
 from ..config import Config
-from ..constants import LOG_NAME
 from ..exceptions import NoDataException
 from ..symbol import Symbol
 from ..utils import parse_decimal
@@ -102,20 +102,23 @@ EXCHANGES = {
 
 
 # Exchange codes to remap
-EXCHANGE_REMAP = {
+EXCHANGE_REMAP = types.MappingProxyType({
     # US exchanges
     "NASDAQ": "US",
     "NYSE": "US",
     # Oslo Stock Exchange
     "OSE": "OL",
-}
+})
 
 
 class FinnhubMarket(Market):
     """Finnhub Market subclass."""
     name = "FinnhubMarket"
     root_url = "https://finnhub.io/api"
-    session = requests.Session()
+    pool_connections = 8
+    pool_maxsize = 32
+    # Max concurrent requests, keeps batched requests within API rate limit
+    max_workers = 30
 
     def __init__(self, config: Config):
         """
@@ -127,7 +130,7 @@ class FinnhubMarket(Market):
         :param config: market config
         :type config: Config
         """
-        self.config = config
+        super().__init__(config)
         self.api_key = config.api_key
         version = getattr(config, "version", "v1")
         self.api_url = f"{self.root_url}/{version}"
@@ -135,21 +138,19 @@ class FinnhubMarket(Market):
         # Disable SSL warnings
         urllib3.disable_warnings()
 
-        # Logger
-        self.logger = logging.getLogger(LOG_NAME)
-
         # Authenticate
         self.authenticate()
         return
 
     def authenticate(self) -> None:
         """
-        Authentication with Finnhub API is through a header. This refreshes
-        the module requests session and adds the header.
+        Authentication with Finnhub API is through a header. Updates the
+        instance session headers, keeping open connections alive.
         """
-        self.session = requests.Session()
         self.session.headers.update({
-            "X-Finnhub-Token": self.api_key
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
+            "X-Finnhub-Token": self.api_key,
         })
         return
 
@@ -328,7 +329,7 @@ class FinnhubMarket(Market):
             "from": from_timestamp - 1,
             "to": to_timestamp + 1,
         }
-        self.logger.debug("Finnhub - Fetching candlesticks using request params {}".format(params))
+        self.logger.debug("Finnhub - Fetching candlesticks using request params %s", params)
         response = self.request("GET", url, data=params, session=self.session)
 
         # Unpack response, validate status and generate candlesticks
@@ -352,10 +353,9 @@ class FinnhubMarket(Market):
             volume = data["v"][i]
             timestamp = datetime.datetime.fromtimestamp(data["t"][i])
             candlesticks.append(Candlestick(open_, high, low, close, volume, timestamp=timestamp))
-        latest_timestamp = datetime.datetime.fromtimestamp(data["t"][-1])
-        self.logger.debug("{} - Latest candlestick timestamp: {}".format(
-            self.name, latest_timestamp
-        ))
+        if (self.logger.isEnabledFor(logging.DEBUG)):
+            latest_timestamp = datetime.datetime.fromtimestamp(data["t"][-1])
+            self.logger.debug("%s - Latest candlestick timestamp: %s", self.name, latest_timestamp)
         return candlesticks
 
     def get_average_price(
@@ -384,14 +384,13 @@ class FinnhubMarket(Market):
         # Get candlesticks
         days = days or 7
         candlesticks = self.get_candlesticks(symbol, "D", days)
-        # Sum prices and volumes
-        total_price = parse_decimal(0)
-        volume = 0
-        for candlestick in candlesticks:
-            total_price += candlestick.close
-            volume += candlestick.volume
+        # Sum prices and volumes as floats, only converting the results to Decimal
+        closes = [float(candlestick.close) for candlestick in candlesticks]
+        volume = sum(
+            float(candlestick.volume) for candlestick in candlesticks if (candlestick.volume)
+        )
         order_history = {
-            "average_price": total_price / len(candlesticks),
-            "volume": volume,
+            "average_price": parse_decimal(sum(closes) / len(closes)),
+            "volume": parse_decimal(volume) if (volume) else 0,
         }
         return order_history
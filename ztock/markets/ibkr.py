@@ -7,6 +7,7 @@ Fetches market data from IBKR.
 WORK IN PROGRESS, NEVER GOT IBKR MARKET DATA TO WORK..
 """
 import urllib3
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 from typing import Dict, List, Optional, Union
 
@@ -24,9 +25,10 @@ class IBKR(Market):
     """
     name = "IBKRMarket"
     timeout = 60
-    retry_on_status_codes = [500]
 
     version = "v1"
+    # Market data snapshot field id for last price
+    last_price_field = "31"
 
     def __init__(self, config: Config) -> None:
         """
@@ -40,13 +42,14 @@ class IBKR(Market):
         :param config: market config
         :type config: Config
         """
-        self.config = config
+        super().__init__(config)
         gateway_url = getattr(config, "gateway_url", "localhost")
         gateway_port = getattr(config, "gateway_port", 5000)
         self.root_url = f"https://{gateway_url}:{gateway_port}/{self.version}/api"
 
-        # Disable localhost SSL warning
+        # Disable localhost SSL warning and verification
         urllib3.disable_warnings()
+        self.session.verify = False
 
         # Query endpoints relevant for subsequent queries
         IBKRBroker.get_portfolio_accounts(self)
@@ -95,6 +98,15 @@ class IBKR(Market):
         :rtype: ztock.broker.Symbol
         """
         contract_type = contract_type or "STK"
+        # Check if previously returned
+        cache_key = (symbol_name, contract_type)
+        symbol = self._symbol_lookup_cache.get(cache_key)
+        if (symbol is not None):
+            return symbol
+        if (cache_key in self._missing_lookup_cache):
+            raise ValueError("IBKR - No {} contract found for symbol: {}".format(
+                contract_type, symbol_name
+            ))
         # Define URL
         url = f"{self.root_url}/iserver/secdef/search"
         # Query API
@@ -112,12 +124,14 @@ class IBKR(Market):
                 if (section.get("symbol", symbol_name) != symbol_name):
                     continue
                 if (section["secType"] == contract_type):
-                    symbol = Symbol(
-                        contracts[0]["symbol"],
-                        **{**contract_info, **section}
-                    )
+                    # Store contract id as int for cheaper hashing and lookups
+                    contract_details = {**contract_info, **section}
+                    contract_details["conid"] = int(contract_details["conid"])
+                    symbol = Symbol(contracts[0]["symbol"], **contract_details)
+                    self._symbol_lookup_cache.set(cache_key, symbol)
                     return symbol
-        # If no contract found, raise error
+        # If no contract found, remember miss and raise error
+        self._missing_lookup_cache.set(cache_key, True)
         raise ValueError("IBKR - No {} contract found for symbol: {}".format(
             contract_type, symbol_name
         ))
@@ -139,24 +153,69 @@ class IBKR(Market):
         :return: current symbol price
         :rtype: decimal.Decimal
         """
-        # Check if Symbol has contract id. If not, lookup symbol name
-        if (getattr(symbol, "conid", None) is None):
-            symbol = self.lookup_symbol(symbol.name)
+        return self.get_symbol_quotes([symbol], price_type)[symbol.name]
+
+    def get_symbol_quotes(
+            self,
+            symbols: List[Symbol],
+            price_type: str = None,
+            max_workers: int = None
+    ) -> Dict[str, Decimal]:
+        """
+        Returns current prices for multiple symbols as symbol name-price
+        key-value pairs. All contract ids are queried in a single snapshot
+        request.
+
+        https://ndcdyn.interactivebrokers.com/api/doc.html#tag/Market-Data/paths/~1iserver~1marketdata~1snapshot/get
+
+        :param symbols: symbols to get quotes for
+        :type symbols: list of ztock.Symbol
+        :param price_type: "bid", "mid" or "ask" price. Defaults to "ask"
+        :type price_type: str
+        :param max_workers: max number of concurrent symbol lookups for symbols
+            without contract ids. Defaults to class max_workers
+        :type max_workers: int
+        :return: current symbol prices
+        :rtype: dict of (str, decimal.Decimal)
+        """
+        if (not symbols):
+            return {}
+
+        # Check if Symbols have contract ids. If not, lookup symbol names concurrently
+        missing = [symbol for symbol in symbols if (getattr(symbol, "conid", None) is None)]
+        resolved = {}
+        if (missing):
+            max_workers = min(max_workers or self.max_workers, len(missing))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                resolved = dict(zip(
+                    [symbol.name for symbol in missing],
+                    executor.map(lambda symbol: self.lookup_symbol(symbol.name), missing)
+                ))
+        id_to_name = {}
+        for symbol in symbols:
+            if (getattr(symbol, "conid", None) is None):
+                symbol = resolved[symbol.name]
+            id_to_name[int(symbol.conid)] = symbol.name
 
         # Define URL
         url = f"{self.root_url}/iserver/marketdata/snapshot"
         # Query API
-        contract_id = symbol.conid
-        last_price_field = "31"
+        last_price_field = self.last_price_field
         data = {
-            "conids": contract_id,
+            "conids": ",".join(map(str, id_to_name)),
             "fields": last_price_field,
         }
         response = self.request("GET", url, data=data)
         # Unpack response
-        results = response.json()
-        last_price = parse_decimal(results[0][last_price_field])
-        return last_price
+        quotes = {}
+        for result in response.json():
+            if ("conid" not in result or last_price_field not in result):
+                continue
+            symbol_name = id_to_name.get(int(result["conid"]), None)
+            if (symbol_name is None):
+                continue
+            quotes[symbol_name] = parse_decimal(result[last_price_field])
+        return quotes
 
     def get_candlesticks(
             self,
@@ -2,6 +2,7 @@
 """
 Base Market class.
 """
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 from typing import Dict, List, Optional, Union
 
@@ -15,6 +16,8 @@ class Market(Client):
     Base Market class, subclasses handle requests to market data vendors.
     """
     name = "Market"
+    # Max concurrent requests for batched quote and candlestick fetching
+    max_workers = 8
 
     def refresh(self):
         """Refreshes client connection."""
@@ -67,6 +70,35 @@ class Market(Client):
         """
         raise NotImplementedError("Market.get_symbol_quote() not implemented")
 
+    def get_symbol_quotes(
+            self,
+            symbols: List[Symbol],
+            price_type: str = None,
+            max_workers: int = None
+    ) -> Dict[str, Decimal]:
+        """
+        Returns current prices for multiple symbols as symbol name-price
+        key-value pairs. Quotes are requested concurrently over the pooled
+        session using get_symbol_quote(). Subclasses with native batch
+        endpoints should override this.
+
+        :param symbols: symbols to get quotes for
+        :type symbols: list of ztock.Symbol
+        :param price_type: "bid", "mid" or "ask" price. Defaults to "ask"
+        :type price_type: str
+        :param max_workers: max concurrent requests, defaults to class max_workers
+        :type max_workers: int
+        :return: current prices per symbol name
+        :rtype: dict of (str, decimal.Decimal)
+        """
+        if (len(symbols) == 0):
+            return {}
+        max_workers = min(max_workers or self.max_workers, len(symbols))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            prices = executor.map(lambda symbol: self.get_symbol_quote(symbol, price_type), symbols)
+            quotes = {symbol.name: price for symbol, price in zip(symbols, prices)}
+        return quotes
+
     def get_candlesticks(
             self,
             symbol: Symbol,
@@ -87,6 +119,54 @@ class Market(Client):
         """
         raise NotImplementedError("Market.get_candlesticks() not implemented")
 
+    def get_candlesticks_batch(
+            self,
+            symbols: List[Symbol],
+            resolution: Union[str, int] = None,
+            intervals: int = None,
+            max_workers: int = None,
+            return_exceptions: bool = False,
+            **kwargs
+    ) -> Dict[str, Union[List[Candlestick], Exception]]:
+        """
+        Fetches candlesticks for multiple symbols concurrently using
+        get_candlesticks(). Returns symbol name-candlesticks key-value pairs.
+        Extra keyword arguments are passed on to get_candlesticks().
+
+        Errors for a single symbol are raised, same as get_candlesticks(),
+        unless return_exceptions is set. The exception is then returned in
+        place of that symbol's candlesticks.
+
+        :param symbols: symbol objects
+        :type symbols: list of ztock.broker.Symbol
+        :param resolution: candlestick interval, defaults to 5 minutes
+        :type resolution: int or str
+        :param intervals: number of intervals to fetch, defaults to 50
+        :type intervals: int
+        :param max_workers: max concurrent requests, defaults to class max_workers
+        :type max_workers: int
+        :param return_exceptions: return per symbol errors instead of raising
+        :type return_exceptions: bool
+        :returns: candlesticks (or exception) per symbol name
+        :rtype: dict of (str, list of ztock.Candlestick)
+        """
+        if (len(symbols) == 0):
+            return {}
+
+        def get_candlesticks(symbol: Symbol) -> Union[List[Candlestick], Exception]:
+            try:
+                return self.get_candlesticks(symbol, resolution, intervals, **kwargs)
+            except Exception as error:
+                if (not return_exceptions):
+                    raise
+                return error
+
+        max_workers = min(max_workers or self.max_workers, len(symbols))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(get_candlesticks, symbols)
+            candlesticks = {symbol.name: candles for symbol, candles in zip(symbols, results)}
+        return candlesticks
+
     def get_average_price(
             self,
             symbol: Symbol,
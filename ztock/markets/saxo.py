@@ -4,39 +4,107 @@ Saxo Bank market data handler.
 
 https://www.developer.saxo
 """
+import atexit
+import threading
+import time
+import types
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Mapping, Optional, Union
 
+import numpy as np
+import requests
+
+# Stream-parse large instrument listings if ijson is installed
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+from .market import Market
 from ..candlestick import Candlestick
 from ..clients.saxo import SaxoClient
+from ..config import Config
 from ..exceptions import NoDataException
-from ..symbol import Symbol
-from ..utils import generate_random_string, parse_decimal
+from ..symbol import Symbol, SymbolTable
+from ..utils import generate_random_string, load_json, parse_decimal
+
+
+EXCHANGE_REMAP = types.MappingProxyType({
+
+})
 
+# Background worker for cancelling chart subscriptions, shared by all market
+# instances and drained on exit
+_CLEANUP_EXECUTOR = None
+_CLEANUP_EXECUTOR_LOCK = threading.Lock()
 
-EXCHANGE_REMAP = {
 
-}
+def _get_cleanup_executor() -> ThreadPoolExecutor:
+    """Returns shared cleanup executor, creating it on first use."""
+    global _CLEANUP_EXECUTOR
+    with _CLEANUP_EXECUTOR_LOCK:
+        if (_CLEANUP_EXECUTOR is None):
+            _CLEANUP_EXECUTOR = ThreadPoolExecutor(max_workers=2)
+            atexit.register(_CLEANUP_EXECUTOR.shutdown, wait=True)
+    return _CLEANUP_EXECUTOR
 
 
-class SaxoMarket(SaxoClient):
+class SaxoMarket(SaxoClient, Market):
     """
     Saxo Market subclass.
     """
     name = "SaxoMarket"
-    security_type_remap = {
+    security_type_remap = types.MappingProxyType({
         "Common Stock": "Stock",
-    }
-    _symbols = {}
+    })
+    # Max number of concurrent exchange symbol list, quote and candlestick requests
+    max_workers = 8
+    # Seconds before cached exchange symbol lists expire
+    symbols_ttl = 86400
+
+    def __init__(self, config: Config) -> None:
+        """
+        Inits Saxo market object using supplied config. See SaxoClient for
+        required config parameters.
+
+        :param config: market config
+        :type config: Config
+        """
+        super().__init__(config)
+        # Exchange symbol lists as (timestamp, symbols) per exchange per symbol type
+        self._symbols = {}
+        return
+
+    def invalidate_symbols(self, exchange_code: Optional[str] = None) -> None:
+        """
+        Clears cached exchange symbol lists in memory and on disk, forcing
+        them to be refetched.
+
+        :param exchange_code: optional Saxo Bank exchange code, clears all
+            exchanges if not given
+        :type exchange_code: str
+        """
+        if (exchange_code is None):
+            self._symbols.clear()
+            self._cache_db.delete(f"{self._cache_prefix}symbols:")
+        else:
+            exchange_code = EXCHANGE_REMAP.get(exchange_code, exchange_code)
+            self._symbols.pop(exchange_code, None)
+            self._cache_db.delete(f"{self._cache_prefix}symbols:{exchange_code}:")
+        return
 
     def list_symbols(
             self, exchange_codes: Union[List[str], str],
             symbol_type: Optional[str] = None, mic_codes: Optional[Union[List[str], str]] = None,
             account_key: Optional[str] = None, include_non_tradeable: Optional[bool] = False
-    ) -> Dict[str, Symbol]:
+    ) -> Mapping[str, Symbol]:
         """
-        Lists symbols for given exchange codes. Returns list of Symbol
-        objects.
+        Lists symbols for given exchange codes. Returns a read-only view of
+        symbol name-Symbol key-value pairs, chained over the cached per
+        exchange symbol lists instead of copying them. Writes to the returned
+        mapping do not affect the cache.
 
         https://www.developer.saxo/openapi/referencedocs/ref/v1/instruments/getsummaries/6e8602a4943e270d01ada208c8b26770
 
@@ -53,54 +121,179 @@ class SaxoMarket(SaxoClient):
             tradeable through online client
         :type include_non_tradeable: bool
         :return: symbols for given exchanges
-        :rtype: dict of (str, ztock.broker.Symbol)
+        :rtype: collections.ChainMap of (str, ztock.broker.Symbol)
         """
         if (isinstance(exchange_codes, str)):
             exchange_codes = [exchange_codes]
+        if (len(exchange_codes) == 0):
+            return {}
         symbol_type = self.security_type_remap.get(symbol_type, symbol_type)
-        # Define URL
+        remap_exchange = EXCHANGE_REMAP.get
+        exchange_codes = [
+            remap_exchange(exchange_code, exchange_code)
+            for exchange_code in exchange_codes
+        ]
+
+        # Validate tokens once before fetching exchanges concurrently
+        self.authenticate()
+        max_workers = min(self.max_workers, len(exchange_codes))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                lambda exchange_code: self._list_exchange_symbols(
+                    exchange_code, symbol_type, account_key, include_non_tradeable
+                ),
+                exchange_codes
+            )
+            per_exchange = list(results)
+        # Later exchanges take precedence on duplicate names, as with dict.update()
+        symbols = ChainMap({}, *reversed(per_exchange))
+        return symbols
+
+    def _list_exchange_symbols(
+            self, exchange_code: str, symbol_type: Optional[str] = None,
+            account_key: Optional[str] = None, include_non_tradeable: Optional[bool] = False
+    ) -> SymbolTable:
+        """
+        Lists symbols for a single exchange, following result pages. Results
+        are cached per exchange and symbol type, in memory and on disk.
+
+        :param exchange_code: Saxo Bank exchange code
+        :type exchange_code: str
+        :param symbol_type: optional Saxo Bank asset type, e.g. "Stock"
+        :type symbol_type: str
+        :param account_key: optional Saxo Bank account key
+        :type account_key: str
+        :param include_non_tradeable: optional flag for including symbols not
+            tradeable through online client
+        :type include_non_tradeable: bool
+        :return: symbols for given exchange
+        :rtype: ztock.symbol.SymbolTable
+        """
+        # Check if cached list exists and has not expired
+        cache_key = symbol_type or "All"
+        cached = self._symbols.get(exchange_code, {}).get(cache_key, None)
+        if (cached is not None):
+            cached_timestamp, cached_symbols = cached
+            if (time.monotonic() - cached_timestamp < self.symbols_ttl):
+                return cached_symbols
+        # Check persistent cache from previous sessions, keeping its age
+        disk_key = f"{self._cache_prefix}symbols:{exchange_code}:{cache_key}"
+        cached = self._cache_db.get(disk_key, self.symbols_ttl)
+        if (cached is not None):
+            age, cached_symbols = cached
+            self._symbols.setdefault(exchange_code, {})[cache_key] = (
+                time.monotonic() - age, cached_symbols
+            )
+            return cached_symbols
+        # Generate and send request with payload
         url = f"{self.root_url}/ref/v1/instruments"
+        params = {
+            "$top": 500,
+            "ExchangeId": exchange_code,
+            "IncludeNonTradable": include_non_tradeable,
+        }
+        if (symbol_type):
+            params["AssetTypes"] = symbol_type
+        if (account_key):
+            params["AccountKey"] = account_key
+        # Unpack result pages and add symbols to table
+        exchange_symbols = SymbolTable()
+        next_url = self._read_symbol_page(url, params, exchange_symbols)
+        while (next_url):
+            next_url = self._read_symbol_page(next_url, None, exchange_symbols)
+        # Cache symbols per exchange per symbol type
+        self._symbols.setdefault(exchange_code, {})[cache_key] = (
+            time.monotonic(), exchange_symbols
+        )
+        self._cache_db.set(disk_key, exchange_symbols)
+        return exchange_symbols
 
-        symbols = {}
-        for exchange_code in exchange_codes:
-            exchange_code = EXCHANGE_REMAP.get(exchange_code, exchange_code)
-            # Check if cached list exists
-            if (
-                    exchange_code in self._symbols and (
-                        (symbol_type is None and "All" in self._symbols[exchange_code])
-                        or symbol_type in self._symbols[exchange_code]
-                    )
-            ):
-                symbols.update(self._symbols[exchange_code][symbol_type or "All"])
-                continue
-            # Generate and send request with payload
-            params = {
-                "$top": 500,
-                "ExchangeId": exchange_code,
-                "IncludeNonTradable": include_non_tradeable,
-            }
-            if (symbol_type):
-                params["AssetTypes"] = self.security_type_remap.get(symbol_type, symbol_type)
-            if (account_key):
-                params["AccountKey"] = account_key
+    def _read_symbol_page(
+            self, url: str, params: Optional[Dict[str, Any]],
+            exchange_symbols: SymbolTable, retry: bool = True
+    ) -> Optional[str]:
+        """
+        Requests a page of instruments and adds them to exchange_symbols.
+        If ijson is installed the response is stream-parsed one instrument
+        at a time, instead of loading the whole page into memory.
+
+        Raises an error if the page is not a complete instrument list, so
+        partial symbol lists are never cached. A rate limited page is
+        retried once after two minutes.
+
+        :param url: instruments URL or next page URL
+        :type url: str
+        :param params: optional request parameters
+        :type params: dict of (str, any)
+        :param exchange_symbols: symbol table to add page symbols to
+        :type exchange_symbols: ztock.symbol.SymbolTable
+        :param retry: flag for retrying a rate limited page
+        :type retry: bool
+        :return: next page URL, if any
+        :rtype: str
+        :raises requests.HTTPError: if response is an error or has no instrument list
+        """
+        if (ijson is None):
             response = self.request("GET", url, data=params)
-            # Unpack result and add Symbols to dict
-            result = response.json()
-            exchange_symbols = {}
+            result = load_json(response)
+            if (not isinstance(result, dict) or not isinstance(result.get("Data", None), list)):
+                error_code = result.get("ErrorCode", None) if (isinstance(result, dict)) else None
+                self._raise_symbol_page_error(response, error_code)
             for symbol_dict in result["Data"]:
-                symbol = self._unpack_symbol(symbol_dict)
-                exchange_symbols[symbol.name] = symbol
-            while (result.get("__next", None)):
-                result = self.request("GET", result["__next"]).json()
-                for symbol_dict in result["Data"]:
-                    symbol = self._unpack_symbol(symbol_dict)
-                    exchange_symbols[symbol.name] = symbol
-            symbols.update(exchange_symbols)
-            # Cache symbols per exchange per symbol type
-            if (exchange_code not in self._symbols):
-                self._symbols[exchange_code] = {}
-            self._symbols[exchange_code][symbol_type or "All"] = exchange_symbols
-        return symbols
+                symbol_name, fields = self._unpack_symbol_fields(symbol_dict)
+                exchange_symbols.add(symbol_name, **fields)
+            return result.get("__next", None)
+
+        next_url = None
+        builder = None
+        error_code = None
+        data_complete = False
+        response = self.request("GET", url, data=params, stream=True)
+        with response:
+            # Only parse successful responses as instrument lists
+            if (response.status_code != 200):
+                self._raise_symbol_page_error(response, None)
+            response.raw.decode_content = True
+            for prefix, event, value in ijson.parse(response.raw, use_float=True):
+                # Build one instrument dict at a time from parser events
+                if (prefix == "Data.item"):
+                    if (event == "start_map"):
+                        builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                    if (event == "end_map"):
+                        symbol_name, fields = self._unpack_symbol_fields(builder.value)
+                        exchange_symbols.add(symbol_name, **fields)
+                        builder = None
+                elif (builder is not None):
+                    builder.event(event, value)
+                elif (prefix == "Data" and event == "end_array"):
+                    data_complete = True
+                elif (prefix == "__next"):
+                    next_url = value
+                elif (prefix == "ErrorCode"):
+                    error_code = value
+
+        if (error_code == "RateLimitExceeded" and retry):
+            self.logger.warning(
+                "{} - Rate limit reached, sleeping for 2 minutes before retry..".format(self.name)
+            )
+            time.sleep(120)
+            return self._read_symbol_page(url, params, exchange_symbols, retry=False)
+        # Incomplete pages raise, discarding the partially filled symbol table
+        if (error_code is not None or not data_complete):
+            self._raise_symbol_page_error(response, error_code)
+        return next_url
+
+    def _raise_symbol_page_error(
+            self, response: requests.Response, error_code: Optional[str]
+    ) -> None:
+        """Raises HTTPError for an instrument page without a complete instrument list."""
+        raise requests.HTTPError(
+            "{} - Invalid instrument list response (HTTP {}, error code: {}): {}".format(
+                self.name, response.status_code, error_code, response.url
+            ),
+            response=response
+        )
 
     def get_symbol_quote(
             self,
@@ -170,7 +363,6 @@ class SaxoMarket(SaxoClient):
         :returns: list of candlestick objects
         :rtype: list of ztock.Candlestick
         """
-        candlesticks = []
         price_type = price_type.title() if (price_type is not None) else "Ask"
 
         # Define URL and parameters
@@ -215,21 +407,21 @@ class SaxoMarket(SaxoClient):
         result = response.json()
         snapshot = result["Snapshot"]
         self.logger.debug("{} - Candlestick info: {}".format(self.name, snapshot["ChartInfo"]))
-        data = snapshot["Data"]
-        for candlestick in data:
-            open_ = candlestick.get(f"Open{price_type}", candlestick.get("Open", None))
-            high = candlestick.get(f"High{price_type}", candlestick.get("High", None))
-            low = candlestick.get(f"Low{price_type}", candlestick.get("Low", None))
-            close = candlestick.get(f"Close{price_type}", candlestick.get("Close", None))
-            volume = candlestick.get("Volume", None)
-            timestamp = self._parse_utc_datestring(candlestick["Time"])
-            candlesticks.append(Candlestick(open_, high, low, close, volume, timestamp))
-
-        # Cancel subscription instantly
+        candlesticks = self._decode_candles(snapshot["Data"], price_type)
+
+        # Cancel subscription in the background, data is already received
         delete_url = f"{self.root_url}/chart/v1/charts/subscriptions/{context_id}/{reference_id}"
-        self.request("DELETE", delete_url)
+        _get_cleanup_executor().submit(self._safe_delete, delete_url)
         return candlesticks
 
+    def _safe_delete(self, url: str) -> None:
+        """Sends DELETE request to url, logging instead of raising errors."""
+        try:
+            self.request("DELETE", url)
+        except Exception:
+            self.logger.exception("{} - Unable to send DELETE request: {}".format(self.name, url))
+        return
+
     def get_candlesticks(
             self,
             symbol: Symbol,
@@ -253,9 +445,62 @@ class SaxoMarket(SaxoClient):
         :returns: list of candlestick objects
         :rtype: list of ztock.Candlestick
         """
-        candlesticks = []
         price_type = price_type.title() if (price_type is not None) else "Ask"
 
+        # Fetch raw chart data and generate candlesticks
+        data = self._get_chart_data(symbol, resolution, intervals)
+        try:
+            candlesticks = self._decode_candles(data, price_type)
+        except Exception:
+            self.logger.error("{} - Unable to unpack candlesticks: {}".format(self.name, data))
+            raise
+        return candlesticks
+
+    def _decode_candles(self, data: List[Dict[str, Any]], price_type: str) -> List[Candlestick]:
+        """
+        Converts chart data rows to candlesticks, using prices for the given
+        price type where available.
+
+        :param data: chart data rows
+        :type data: list of dict
+        :param price_type: "Bid", "Ask" or "Mid"
+        :type price_type: str
+        :returns: list of candlestick objects
+        :rtype: list of ztock.Candlestick
+        """
+        open_key, high_key = f"Open{price_type}", f"High{price_type}"
+        low_key, close_key = f"Low{price_type}", f"Close{price_type}"
+        parse_timestamp = self._parse_utc_datestring
+        return [
+            Candlestick(
+                row.get(open_key, row.get("Open", None)),
+                row.get(high_key, row.get("High", None)),
+                row.get(low_key, row.get("Low", None)),
+                row.get(close_key, row.get("Close", None)),
+                row.get("Volume", None),
+                parse_timestamp(row["Time"])
+            )
+            for row in data
+        ]
+
+    def _get_chart_data(
+            self,
+            symbol: Symbol,
+            resolution: Union[str, int] = None,
+            intervals: int = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetches raw chart data rows for symbol, as returned by the API.
+
+        :param symbol: symbol object
+        :type symbol: ztock.broker.Symbol
+        :param resolution: candlestick interval, defaults to 5 minutes
+        :type resolution: int or str
+        :param intervals: number of intervals to fetch, defaults to 50
+        :type intervals: int
+        :returns: chart data rows
+        :rtype: list of dict
+        """
         # Define URL and parameters
         url = f"{self.root_url}/chart/v1/charts"
         resolution = resolution or 5
@@ -284,25 +529,21 @@ class SaxoMarket(SaxoClient):
         self.logger.debug(
             "{} - Fetching candlesticks using request params: {}".format(self.name, params)
         )
-        response = self.request("GET", url, data=params)
+        # Validate tokens first, a token refresh clears cached prepared requests
+        self.authenticate()
+        cache_key = ("charts", params["AssetType"], symbol.Identifier, resolution, intervals)
+        prepared = self._prepared_requests.get(cache_key, None)
+        if (prepared is None):
+            prepared = self.session.prepare_request(requests.Request("GET", url, params=params))
+            self._prepared_requests.set(cache_key, prepared)
+        response = self.request(
+            "GET", url, data=params, authenticate=False, prepared=prepared
+        )
 
-        # Unpack response, validate status and generate candlesticks
-        result = response.json()
+        # Unpack response
+        result = load_json(response)
         self.logger.debug("{} - Candlestick info: {}".format(self.name, result["ChartInfo"]))
-        data = result["Data"]
-        try:
-            for candlestick in data:
-                open_ = candlestick.get(f"Open{price_type}", candlestick.get("Open", None))
-                high = candlestick.get(f"High{price_type}", candlestick.get("High", None))
-                low = candlestick.get(f"Low{price_type}", candlestick.get("Low", None))
-                close = candlestick.get(f"Close{price_type}", candlestick.get("Close", None))
-                volume = candlestick.get("Volume", None)
-                timestamp = self._parse_utc_datestring(candlestick["Time"])
-                candlesticks.append(Candlestick(open_, high, low, close, volume, timestamp))
-        except Exception:
-            self.logger.error("{} - Unable to unpack candlesticks: {}".format(self.name, data))
-            raise
-        return candlesticks
+        return result["Data"]
 
     def get_average_price(
             self,
@@ -329,16 +570,24 @@ class SaxoMarket(SaxoClient):
         # Get candlesticks
         days = days or 7
         price_type = "bid" if (operation.upper() == "SELL") else "ask"
-        candlesticks = self.get_candlesticks(symbol, "D", days, price_type=price_type)
-        # Sum prices and volumes
-        total_price = parse_decimal(0)
-        volume = 0
-        for candlestick in candlesticks:
-            total_price += candlestick.close
-            if (candlestick.volume):
-                volume += candlestick.volume
+        data = self._get_chart_data(symbol, "D", days)
+        if (len(data) == 0):
+            raise NoDataException(f"{self.name} - No chart data returned for symbol {symbol.name}")
+        # Average close prices and sum volumes as floats, missing values are skipped
+        close_key = f"Close{price_type.title()}"
+        closes = np.fromiter(
+            (row.get(close_key, row.get("Close", None)) for row in data),
+            dtype=np.float64, count=len(data)
+        )
+        volumes = np.fromiter(
+            (row.get("Volume", None) for row in data),
+            dtype=np.float64, count=len(data)
+        )
+        if (np.isnan(closes).all()):
+            raise NoDataException(f"{self.name} - No close prices returned for symbol {symbol.name}")
+        volume = np.nansum(volumes)
         order_history = {
-            "average_price": total_price / len(candlesticks),
-            "volume": volume or None,
+            "average_price": parse_decimal(float(np.nanmean(closes))),
+            "volume": parse_decimal(float(volume)) if (volume) else 0,
         }
         return order_history
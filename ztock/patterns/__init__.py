@@ -3,12 +3,15 @@
 Pattern recognition functionality.
 """
 from .pattern import Pattern
-from .candlestick import CandlestickPattern, get_candlestick_patterns, analyze_candlesticks
+from .candlestick import (
+    CandlestickPattern, PatternResult, get_candlestick_patterns, analyze_candlesticks
+)
 
 
 __all__ = [
     "CandlestickPattern",
     "Pattern",
+    "PatternResult",
 
     "analyze_candlesticks",
     "get_candlestick_patterns",
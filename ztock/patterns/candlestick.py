@@ -2,24 +2,34 @@
 """
 Functions for analyzing candlestick patterns using TA-lib.
 """
-from typing import Callable, Dict, List
+from typing import Callable, Dict, List, NamedTuple, Union
 
 import numpy as np
+import talib
 import talib.abstract
 from numpy import ndarray
 
 from .pattern import Pattern
-from ..candlestick import Candlestick
+from ..candlestick import Candlestick, CandlestickSeries
+
+
+class PatternResult(NamedTuple):
+    """Weighted indication value for a named candlestick pattern."""
+    name: str
+    indication: float
 
 
 class CandlestickPattern(Pattern):
-    """Base candlestick pattern class."""
-    timestamp = None
+    """
+    Base candlestick pattern class. Pattern objects hold no analysis state,
+    so the module level pattern list is shared between analyses.
+    """
+    __slots__ = ("name", "function", "validators", "weight", "lookback")
 
     def __init__(
             self,
             name: str,
-            talib_func: Callable[[Dict[str, ndarray]], float],
+            talib_func: Callable[..., ndarray],
             validators: List[Callable[..., bool]] = None,
             weight: int = None
     ) -> None:
@@ -28,7 +38,7 @@ class CandlestickPattern(Pattern):
 
         :param name: name of pattern
         :type name: str
-        :param talib_func: TA-Lib package function
+        :param talib_func: TA-Lib function taking open, high, low and close arrays
         :type talib_func: def
         :param validators: functions for validating recognized pattern
         :type validators: list of def
@@ -39,45 +49,53 @@ class CandlestickPattern(Pattern):
         self.function = talib_func
         self.validators = validators
         self.weight = weight or 1.0
+        # Number of prior candlesticks the TA-Lib function needs for one result
+        self.lookback = talib.abstract.Function(talib_func.__name__).lookback
         return
 
-    def get_indication(self, candlesticks: Candlestick) -> float:
+    def get_indication(
+            self, candlesticks: Union[CandlestickSeries, List[Candlestick]]
+    ) -> float:
         """
         Analyzes candlesticks for defined pattern.
 
         :param candlesticks: candlesticks to analyze for pattern
-        :type candlesticks: list of Candlestick
+        :type candlesticks: ztock.candlestick.CandlestickSeries or list of Candlestick
         :return: pattern indication value
         :rtype: float
         """
-        # Extract candlestick values to convert to numpy arrays
-        open_, high, low, close, volume = [], [], [], [], []
-        for candle in candlesticks:
-            open_.append(candle.open)
-            high.append(candle.high)
-            low.append(candle.low)
-            close.append(candle.close)
-            volume.append(candle.volume)
-        # Convert to numpy arrays
-        inputs = {
-            'open': np.asarray(open_, dtype=np.float64),
-            'high': np.asarray(high, dtype=np.float64),
-            'low': np.asarray(low, dtype=np.float64),
-            'close': np.asarray(close, dtype=np.float64),
-            'volume': np.asarray(volume, dtype=np.float64)
-        }
-
-        # Optionally add timestamp
-        if (candlesticks[-1].timestamp is not None):
-            self.timestamp = candlesticks[-1].timestamp
+        if (not isinstance(candlesticks, CandlestickSeries)):
+            candlesticks = CandlestickSeries.from_candlesticks(candlesticks)
+        inputs = candlesticks.as_inputs()
 
         # Run pattern detection and validate results
-        analysis = self.function(inputs)
-        indication = analysis[-1]
+        indication = self.raw_indication(inputs)
+        # Most candlesticks match no pattern, skip validation
+        if (indication == 0.0):
+            return 0.0
         if (not self.validate(indication, inputs)):
-            indication = 0.0
-        self.indication = indication * self.weight
-        return self.indication
+            return 0.0
+        return indication * self.weight
+
+    def raw_indication(self, inputs: Dict[str, ndarray]) -> float:
+        """
+        Runs pattern detection for the latest candlestick, without validation
+        or weighting. Only the candlesticks within the pattern function
+        lookback are passed to TA-Lib, cast to the float64 it requires.
+
+        :param inputs: input candlestick values
+        :type inputs: dict of (str, numpy.ndarray)
+        :return: raw pattern indication value
+        :rtype: float
+        """
+        window = -(self.lookback + 1)
+        analysis = self.function(
+            inputs["open"][window:].astype(np.float64, copy=False),
+            inputs["high"][window:].astype(np.float64, copy=False),
+            inputs["low"][window:].astype(np.float64, copy=False),
+            inputs["close"][window:].astype(np.float64, copy=False)
+        )
+        return analysis[-1]
 
     def validate(self, indication: float, inputs: Dict[str, ndarray]) -> bool:
         """
@@ -154,132 +172,166 @@ def reversal_if_previous_trend_skip3(indication, inputs):
     return reversal_if_trend(indication, inputs, skip=3)
 
 
-def analyze_candlesticks(candles: List[Candlestick]) -> List[CandlestickPattern]:
+def analyze_candlesticks(
+        candles: Union[CandlestickSeries, List[Candlestick]]
+) -> List[PatternResult]:
     """
-    Uses TA-Lib to analyze candlesticks, and returns
-    a result dict containing the following keys:
+    Uses TA-Lib to analyze candlesticks, and returns a list of pattern names
+    and weighted indication values for every checked pattern.
 
-    :param candles: list of Candlestick objects
-    :type candles: list of ztock.Candlestick
-    :return: list of checked patterns
-    :rtype: list of ztock.patterns.CandlestickPattern
+    :param candles: candlestick series or list of Candlestick objects
+    :type candles: ztock.candlestick.CandlestickSeries or list of ztock.Candlestick
+    :return: list of checked pattern results
+    :rtype: list of ztock.patterns.PatternResult
     """
-    results = get_candlestick_patterns()
-    for pattern in results:
-        pattern.get_indication(candles)
-    return results
+    # Convert candlesticks to arrays once, shared by all patterns
+    if (not isinstance(candles, CandlestickSeries)):
+        candles = CandlestickSeries.from_candlesticks(candles)
+    inputs = candles.as_inputs()
 
+    # Run all pattern detections and weight results. validate() accepts every
+    # nonzero indication, and zero indications stay zero, so validators never
+    # change the result and are not run here
+    indications = _raw_indications(inputs) * _WEIGHTS
+    return [
+        PatternResult(pattern.name, indication)
+        for pattern, indication in zip(_PATTERNS, indications.tolist())
+    ]
 
-def get_candlestick_patterns():
+
+def _raw_indications(inputs: Dict[str, ndarray]) -> ndarray:
+    """
+    Runs all pattern detection functions on the same inputs, returning the
+    latest raw indication value per pattern in _PATTERNS order.
+    """
+    raw_indications = np.empty(len(_PATTERNS), dtype=np.float64)
+    for i, pattern in enumerate(_PATTERNS):
+        raw_indications[i] = pattern.raw_indication(inputs)
+    return raw_indications
+
+
+def get_candlestick_patterns() -> List[CandlestickPattern]:
     """
-    Returns list of CandlestickPattern recognition functions
+    Returns list of CandlestickPattern recognition functions. The list is
+    built once and shared, do not modify it.
+    """
+    return _PATTERNS
+
+
+def _build_patterns() -> List[CandlestickPattern]:
+    """
+    Builds list of CandlestickPattern recognition functions
     """
     # pylint: disable=no-member
     patterns = [
         CandlestickPattern(
             "Abandoned baby",
-            talib.abstract.CDLABANDONEDBABY,
+            talib.CDLABANDONEDBABY,
             [reversal_if_trend],
             weight=2.0
         ),
         CandlestickPattern(
             "Breakaway",
-            talib.abstract.CDLBREAKAWAY,
+            talib.CDLBREAKAWAY,
             [reversal_if_trend],
             weight=2.0
         ),
         CandlestickPattern(
             "Dark cloud cover",
-            talib.abstract.CDLDARKCLOUDCOVER,
+            talib.CDLDARKCLOUDCOVER,
             [reversal_if_previous_trend_skip1]
         ),
         CandlestickPattern(
             "Dragonfly doji",
-            talib.abstract.CDLDRAGONFLYDOJI,
+            talib.CDLDRAGONFLYDOJI,
             [reversal_if_long_trend]
         ),
         CandlestickPattern(
             "Engulfing pattern",
-            talib.abstract.CDLENGULFING,
+            talib.CDLENGULFING,
             [reversal_if_previous_trend_skip1]
         ),
         CandlestickPattern(
             "Evening doji star",
-            talib.abstract.CDLEVENINGDOJISTAR,
+            talib.CDLEVENINGDOJISTAR,
             [reversal_if_long_trend]
         ),
         CandlestickPattern(
             "Evening star",
-            talib.abstract.CDLEVENINGSTAR,
+            talib.CDLEVENINGSTAR,
             [reversal_if_trend],
             weight=2.0
         ),
         CandlestickPattern(
             "Hammer",
-            talib.abstract.CDLHAMMER,
+            talib.CDLHAMMER,
             [reversal_if_long_trend]
         ),
         CandlestickPattern(
             "Hanging man",
-            talib.abstract.CDLHANGINGMAN,
+            talib.CDLHANGINGMAN,
             [reversal_if_long_trend]
         ),
         CandlestickPattern(
             "Morning doji star",
-            talib.abstract.CDLMORNINGDOJISTAR,
+            talib.CDLMORNINGDOJISTAR,
             [reversal_if_long_trend]
         ),
         CandlestickPattern(
             "Morning star",
-            talib.abstract.CDLMORNINGSTAR,
+            talib.CDLMORNINGSTAR,
             [reversal_if_trend]
         ),
         CandlestickPattern(
             "Shooting star",
-            talib.abstract.CDLSHOOTINGSTAR,
+            talib.CDLSHOOTINGSTAR,
             [reversal_if_trend]
         ),
         CandlestickPattern(
             "Three advancing white soldiers",
-            talib.abstract.CDL3WHITESOLDIERS,
+            talib.CDL3WHITESOLDIERS,
             [reversal_if_previous_trend_skip3]
         ),
         CandlestickPattern(
             "Three black crows",
-            talib.abstract.CDL3BLACKCROWS,
+            talib.CDL3BLACKCROWS,
             [reversal_if_previous_trend_skip3],
             weight=2.0
         ),
         CandlestickPattern(
             "Three inside up/down",
-            talib.abstract.CDL3INSIDE,
+            talib.CDL3INSIDE,
             [reversal_if_previous_trend_skip3]
         ),
         CandlestickPattern(
             "Three line strike",
-            talib.abstract.CDL3LINESTRIKE,
+            talib.CDL3LINESTRIKE,
             [reversal_if_previous_trend_skip3],
             weight=2.0
         ),
         CandlestickPattern(
             "Three outside up/down",
-            talib.abstract.CDL3OUTSIDE,
+            talib.CDL3OUTSIDE,
             [reversal_if_previous_trend_skip3]
         ),
         CandlestickPattern(
             "Two crows",
-            talib.abstract.CDL2CROWS,
+            talib.CDL2CROWS,
             [reversal_if_previous_trend_skip1]
         ),
         CandlestickPattern(
             "Upside gap with two crows",
-            talib.abstract.CDLUPSIDEGAP2CROWS,
+            talib.CDLUPSIDEGAP2CROWS,
             [reversal_if_previous_trend_skip1]
         ),
         CandlestickPattern(
             "Upside/Downside Gap Three Methods",
-            talib.abstract.CDLXSIDEGAP3METHODS,
+            talib.CDLXSIDEGAP3METHODS,
             [reversal_if_previous_trend_skip1]
         ),
     ]
     return patterns
+
+
+_PATTERNS = _build_patterns()
+_WEIGHTS = np.array([pattern.weight for pattern in _PATTERNS], dtype=np.float64)
@@ -3,5 +3,7 @@ Base pattern class.
 """
 class Pattern:
     """Base Pattern class."""
+    __slots__ = ()
+
     def __init__(self):
         return
@@ -3,10 +3,18 @@
 Base Symbol class. Unifies and keeps track of symbol parameters across brokers
 and market data vendors.
 """
+from collections.abc import Mapping
+from typing import Any, Iterator, List
 
 
 class Symbol:
     """Base Symbol class."""
+    # Common fields are stored in slots, vendor specific fields in __dict__
+    __slots__ = (
+        "name", "type", "currency", "description", "display_symbol",
+        "exchange", "mic", "figi", "__dict__"
+    )
+
     def __init__(self, name: str, **kwargs):
         """
         Inits Symbol object with defined name and optional keyword arguments.
@@ -40,8 +48,96 @@ class Symbol:
 
     def __repr__(self) -> str:
         """Prints symbol name along with exchange, if defined."""
-        return f"{self.name} {vars(self)})"
+        fields = {
+            key: getattr(self, key, None)
+            for key in self.__slots__[1:-1]
+        }
+        fields.update(vars(self))
+        return f"{self.name} {fields}"
 
     def __str__(self) -> str:
         """See __repr__"""
         return self.__repr__()
+
+
+class _Missing:
+    """Marker for fields not set on a SymbolTable row. Pickles by reference."""
+    def __reduce__(self) -> str:
+        return "_MISSING"
+
+
+_MISSING = _Missing()
+
+
+class SymbolTable(Mapping):
+    """
+    Read-only mapping of symbol name-Symbol pairs, stored column-wise.
+
+    Symbol keyword fields are kept in one list per field instead of one
+    object per symbol, which keeps large exchange symbol lists compact.
+    Symbol objects are created on access.
+    """
+    def __init__(self) -> None:
+        """Inits empty symbol table."""
+        self._index = {}
+        self._columns = {}
+        return
+
+    def add(self, name: str, **kwargs) -> None:
+        """
+        Adds symbol with keyword fields to table, replacing any existing row
+        with the same name.
+
+        :param name: symbol name
+        :type name: str
+        """
+        row = self._index.get(name, None)
+        if (row is None):
+            row = len(self._index)
+            self._index[name] = row
+            for column in self._columns.values():
+                column.append(_MISSING)
+        for key, column in self._columns.items():
+            column[row] = kwargs.pop(key, _MISSING)
+        # Add columns for fields not seen before
+        for key, value in kwargs.items():
+            column = [_MISSING] * len(self._index)
+            column[row] = value
+            self._columns[key] = column
+        return
+
+    def column(self, key: str) -> List[Any]:
+        """
+        Returns list of field values per symbol, in insertion order. Missing
+        values are None.
+
+        :param key: symbol field name
+        :type key: str
+        :return: field values
+        :rtype: list
+        """
+        column = self._columns.get(key, None)
+        if (column is None):
+            return [None] * len(self._index)
+        return [None if (value is _MISSING) else value for value in column]
+
+    def __getitem__(self, name: str) -> Symbol:
+        row = self._index[name]
+        kwargs = {
+            key: column[row]
+            for key, column in self._columns.items()
+            if (column[row] is not _MISSING)
+        }
+        return Symbol(name, **kwargs)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __repr__(self) -> str:
+        return f"SymbolTable({len(self)} symbols)"
@@ -1,24 +1,34 @@
 # -*- coding: utf-8 -*-
+import copy
 import datetime
 import logging
 import math
+import time
 import uuid
 from decimal import Decimal
-from typing import List, Optional
+from typing import Dict, FrozenSet, List, Mapping, Optional
 
 from requests import HTTPError
 
 from . import patterns, utils
 from .brokers import Position, init_broker
+from .candlestick import CandlestickSeries
 from .config import Config
 from .constants import LOG_NAME, ORDER_LOG_NAME
 from .currency import convert_currency
 from .exceptions import NoDataException, UnknownExchange
-from .exchange import Exchange
+from .exchange import Exchange, get_exchange
 from .markets import Market
-from .patterns.candlestick import CandlestickPattern
+from .patterns import PatternResult
 from .symbol import Symbol
-from .utils import pprint_number
+from .utils import parse_decimal, pprint_number
+
+
+def _prefix(value: Optional[object]) -> str:
+    """Returns value followed by a space for log messages, or empty string if not set."""
+    if (not value):
+        return ""
+    return f"{value} "
 
 
 class Trader:
@@ -26,6 +36,10 @@ class Trader:
     Main trader module, used to read config, init broker and market data objects
     and perform trading runs.
     """
+    # Default max number of concurrent candlestick requests, can be overridden
+    # by config max_fetch_workers
+    max_fetch_workers = 8
+
     def __init__(self, config: Config, market: Market) -> None:
         """
         Trading wrapper for broker APIs. Reads vendor and authentication info
@@ -52,6 +66,20 @@ class Trader:
             self.logger.exception("Unable to init trader")
             raise
 
+        # Configured exchange code-symbol names pairs, and set of all configured
+        # symbol names. Traders are reinitialized when trader config changes
+        self._exchanges = dict(vars(self.config.exchanges))
+        self._symbol_names = frozenset(
+            symbol_name
+            for user_symbols in self._exchanges.values()
+            for symbol_name in user_symbols
+        )
+
+        # Exchange open status per exchange code, reset every trading run
+        self._open_exchanges = {}
+        # Exchange symbol lists per exchange code, along with date fetched
+        self._exchange_symbols = {}
+
         # Set next run to now
         self.next_run = datetime.datetime.now()
         return
@@ -104,9 +132,7 @@ class Trader:
         :param exchange: optional exchange object
         :type exchange: ztock.Exchange
         """
-        self.logger.debug("{} - Preparing market buy order for {}".format(
-            self.broker.name, symbol
-        ))
+        self.logger.debug("%s - Preparing market buy order for %s", self.broker.name, symbol)
         # Get symbol quote
         price = self.market.get_symbol_quote(symbol)
         if (symbol.currency != self.broker.currency):
@@ -122,73 +148,65 @@ class Trader:
         buy_amount = self.broker.cash_balance * self.config.buy_fraction
         quantity = math.floor(buy_amount / account_currency_price)
         order_amount = quantity * account_currency_price
+        currency = self.broker.currency
         self.logger.debug(
-            "{0} - Buy fraction: {1:.2f} {2} ({3:.2f} {2} * {4}). "
-            "Order amount: {5:.2f} {2} ({6} * {7:.2f} {2})".format(
-                self.broker.name, buy_amount, self.broker.currency, self.broker.cash_balance,
-                self.config.buy_fraction, order_amount, quantity, account_currency_price
-            )
+            "%s - Buy fraction: %.2f %s (%.2f %s * %s). Order amount: %.2f %s (%s * %.2f %s)",
+            self.broker.name, buy_amount, currency, self.broker.cash_balance, currency,
+            self.config.buy_fraction, order_amount, currency, quantity,
+            account_currency_price, currency
         )
         # Adjust to minimum configured buy value
         min_buy_amount = getattr(self.config, "min_buy_amount", 0)
-        if (order_amount < min_buy_amount):
-            while (account_currency_price and order_amount < min_buy_amount):
-                quantity += 1
-                order_amount = quantity * account_currency_price
+        if (order_amount < min_buy_amount and account_currency_price):
+            quantity = math.ceil(parse_decimal(min_buy_amount) / account_currency_price)
+            order_amount = quantity * account_currency_price
             self.logger.debug(
-                "{0} - Adjusting order amount to minimum buy: {1:.2f} {2} "
-                "({3} * {4:.2f} {2})".format(
-                    self.broker.name, order_amount, self.broker.currency,
-                    quantity, account_currency_price
-                )
+                "%s - Adjusting order amount to minimum buy: %.2f %s (%s * %.2f %s)",
+                self.broker.name, order_amount, currency, quantity,
+                account_currency_price, currency
             )
         # Adjust to maximum configured buy value
         max_buy_amount = getattr(self.config, "max_buy_amount", None)
         if (max_buy_amount and order_amount > max_buy_amount):
             if (quantity == 1):
                 self.logger.warning(
-                    "{} - {}: No buy order, stock price exceeds configured "
-                    "maximum buy amount ({:.2f} > {:.2f})".format(
-                        self.broker.name, symbol.name, order_amount, max_buy_amount
-                    )
+                    "%s - %s: No buy order, stock price exceeds configured "
+                    "maximum buy amount (%.2f > %.2f)",
+                    self.broker.name, symbol.name, order_amount, max_buy_amount
                 )
                 return
-            while (account_currency_price and quantity > 1 and order_amount > max_buy_amount):
-                quantity -= 1
+            if (account_currency_price):
+                quantity = max(
+                    1, math.floor(parse_decimal(max_buy_amount) / account_currency_price)
+                )
                 order_amount = quantity * account_currency_price
             self.logger.debug(
-                "{0} - Adjusting order amount to maximum buy: {1:.2f} {2} "
-                "({3} * {4:.2f} {2})".format(
-                    self.broker.name, order_amount, self.broker.currency,
-                    quantity, account_currency_price
-                )
+                "%s - Adjusting order amount to maximum buy: %.2f %s (%s * %.2f %s)",
+                self.broker.name, order_amount, currency, quantity,
+                account_currency_price, currency
             )
 
         # Check if we have funds
         min_broker_balance = getattr(self.config, "min_broker_cash_balance", 0)
         if (order_amount > self.broker.cash_balance + min_broker_balance):
             self.logger.info(
-                "{0} - {1}: No buy order, funds too low ({2:.2f} {3} > {4:.2f} {3} + {5:.2f} {3})"
-                " to place order".format(
-                    self.broker.name, symbol.name, order_amount, self.broker.currency,
-                    self.broker.cash_balance, min_broker_balance
-                )
+                "%s - %s: No buy order, funds too low (%.2f %s > %.2f %s + %.2f %s) to place order",
+                self.broker.name, symbol.name, order_amount, currency,
+                self.broker.cash_balance, currency, min_broker_balance, currency
             )
             return
 
         # Place buy order
         try:
             self.logger.info(
-                "{0} - Placing {1} market buy order: {2:.2f} {3} @ {4:.2f} {5} "
-                "(total: {6:.2f} {5})".format(
-                    self.broker.name, exchange or "", quantity, symbol.name, price,
-                    symbol.currency, quantity * price
-                ).replace("  ", " ")
+                "%s - Placing %smarket buy order: %.2f %s @ %.2f %s (total: %.2f %s)",
+                self.broker.name, _prefix(exchange), quantity, symbol.name, price,
+                symbol.currency, quantity * price, symbol.currency
             )
             order = self.broker.place_buy_order(symbol, quantity=quantity, exchange=exchange)
-            self.logger.info("{} - {}: Buy order {} placed".format(
-                self.broker.name, symbol.name, order.id
-            ))
+            self.logger.info(
+                "%s - %s: Buy order %s placed", self.broker.name, symbol.name, order.id
+            )
         except Exception:
             self.logger.exception("Unable to place market buy order")
         return
@@ -200,18 +218,16 @@ class Trader:
         :param position: position to close
         :type order: ztock.broker.Position
         """
-        self.logger.debug("Preparing market sell order for {}".format(position.symbol))
+        self.logger.debug("Preparing market sell order for %s", position.symbol)
         # Get symbol quote
         price = self.market.get_symbol_quote(position.symbol)
         exchange = getattr(position.symbol, "exchange", None)
 
         try:
             self.logger.info(
-                "Placing {0} market sell order: {1:.2f} {2} @ {3:.2f} {4} "
-                "(total: {5:.2f} {4})".format(
-                    exchange or "", position.quantity, position.symbol.name, price,
-                    self.broker.currency, position.quantity * price
-                ).replace("  ", " ")
+                "Placing %smarket sell order: %.2f %s @ %.2f %s (total: %.2f %s)",
+                _prefix(exchange), position.quantity, position.symbol.name, price,
+                self.broker.currency, position.quantity * price, self.broker.currency
             )
             order = self.broker.place_sell_order(position)
             order_log_msg = "{}: Sell order {} placed".format(position.symbol.name, order.id)
@@ -224,44 +240,39 @@ class Trader:
             self,
             symbol_name: str,
             avg_indication: float,
-            results: List[CandlestickPattern]
+            results: List[PatternResult]
     ) -> None:
         """Logs newly recognized patterns along with average indication."""
+        if (not self.logger.isEnabledFor(logging.INFO)):
+            return
         recognized_patterns = [pattern for pattern in results if pattern.indication != 0.0]
         pattern_strings = [
             "{} [{}]".format(pattern.name, pattern.indication)
             for pattern in recognized_patterns
         ]
         self.logger.info(
-            "{}: Average indication value: {}. Pattern(s): {}".format(
-                symbol_name, round(avg_indication, 2), ", ".join(pattern_strings)
-            )
+            "%s: Average indication value: %s. Pattern(s): %s",
+            symbol_name, round(avg_indication, 2), ", ".join(pattern_strings)
         )
         return
 
     def get_symbols(self, pick_random: bool = True) -> List[Symbol]:
         """Generates list of symbols to analyze for patterns based on user configuration."""
         symbols = []
-        exchanges = vars(self.config.exchanges)
-        for exchange_code, user_symbols in exchanges.items():
+        for exchange_code, user_symbols in self._exchanges.items():
             # Check if exchange is open
             try:
-                exchange = Exchange(exchange_code)
-                if (not exchange.is_open()):
+                if (not self._is_exchange_open(exchange_code)):
                     self.logger.info(
-                        "Exchange {} is closed, skipping related symbols".format(exchange_code)
+                        "Exchange %s is closed, skipping related symbols", exchange_code
                     )
                     continue
             except UnknownExchange:
-                self.logger.error("Unknown exchange code: {}".format(exchange_code))
+                self.logger.error("Unknown exchange code: %s", exchange_code)
 
-            # Get exchange symbols and look for any configured symbols to add
-            try:
-                exchange_symbols = self.market.list_symbols(exchange_code, "Common Stock")
-            except NotImplementedError:
-                # Market data vendor does not supply symbol list. Generate
-                # Symbol classes per user symbol instead
-                exchange_symbols = None
+            # Get exchange symbols and look for any configured symbols to add.
+            # None if market data vendor does not supply symbol list
+            exchange_symbols = self._list_exchange_symbols(exchange_code)
 
             for user_symbol in user_symbols:
                 # Check for random symbol flag. Only works when list of all
@@ -275,14 +286,15 @@ class Trader:
                         random_symbols = utils.pick_random_symbols(
                             n_rand, exchange_symbols, user_symbols
                         )
-                        self.logger.info("Adding {} random symbols from exchange {}: {}".format(
+                        self.logger.info(
+                            "Adding %s random symbols from exchange %s: %s",
                             n_rand, exchange_code, [symbol.name for symbol in random_symbols]
-                        ))
+                        )
                         symbols.extend(random_symbols)
                     else:
                         self.logger.warning(
                             "Market data vendor does not support exchange symbol list, "
-                            "unable to add random symbols from {}".format(exchange_code)
+                            "unable to add random symbols from %s", exchange_code
                         )
 
                 else:
@@ -290,8 +302,8 @@ class Trader:
                         # Exchange symbols generated, see if user symbol is in list
                         if (user_symbol not in exchange_symbols):
                             self.logger.error(
-                                "Symbol {} not found in exchange {}, skipping "
-                                "symbol".format(user_symbol, exchange_code)
+                                "Symbol %s not found in exchange %s, skipping symbol",
+                                user_symbol, exchange_code
                             )
                             continue
                         symbols.append(exchange_symbols[user_symbol])
@@ -302,31 +314,32 @@ class Trader:
                         symbols.append(symbol)
         return symbols
 
-    def get_symbol_names(self) -> List[str]:
-        """Returns a list of configured symbol names to trade across exchanges."""
-        symbol_names = []
-        exchanges = vars(self.config.exchanges)
-        for user_symbols in exchanges.values():
-            symbol_names.extend(user_symbols)
-        return symbol_names
+    def get_symbol_names(self) -> FrozenSet[str]:
+        """Returns a set of configured symbol names to trade across exchanges."""
+        return self._symbol_names
 
-    def check_positions_for_sell_candidates(self):
+    def check_positions_for_sell_candidates(self) -> List[Position]:
         """
         Fetches open trades, analyses candlesticks for negative trend patterns
         and tries to sell high.
+
+        :return: all open positions, as fetched before placing sell orders
+        :rtype: list of ztock.broker.Position
         """
         self.logger.info("Inspecting open positions for sell candidates")
 
         # Get positions
         positions = self.broker.get_positions()
-        self.logger.debug("{} - Current open positions: {}".format(self.broker.name, positions))
+        self.logger.debug("%s - Current open positions: %s", self.broker.name, positions)
 
-        # Remove positions in closed in exchanges
-        self.remove_closed_exchange_positions(positions)
-        # Remove non-configured symbols
-        self.remove_non_configured_positions(positions)
+        # Remove positions in closed in exchanges and non-configured symbols
+        # from a copy, all positions are returned for reuse
+        sell_positions = list(positions)
+        self.remove_closed_exchange_positions(sell_positions)
+        self.remove_non_configured_positions(sell_positions)
 
-        for position in positions:
+        candidates = []
+        for position in sell_positions:
             # Perform profitability check, if enabled
             if (
                     hasattr(self.config, "profit_check")
@@ -336,157 +349,155 @@ class Trader:
                 min_profit = position.market_value * min_profit_fraction
                 min_profit += self.broker.minimum_order_fee * 2
                 if (position.pnl is not None and position.pnl < min_profit):
+                    currency = position.currency
                     self.logger.info(
-                        "{0}: Skipping analysis due to profitability check: "
-                        "{1:.2f} {2} < {3:.2f} {2} target ({4:.2f} {2} * {5} + "
-                        "{6} {2} * 2)".format(
-                            position.symbol.name, position.pnl, position.currency,
-                            min_profit, position.market_value, pprint_number(min_profit_fraction),
-                            self.broker.minimum_order_fee
-                        )
+                        "%s: Skipping analysis due to profitability check: "
+                        "%.2f %s < %.2f %s target (%.2f %s * %s + %s %s * 2)",
+                        position.symbol.name, position.pnl, currency, min_profit, currency,
+                        position.market_value, currency, pprint_number(min_profit_fraction),
+                        self.broker.minimum_order_fee, currency
                     )
                     continue
+            candidates.append(position)
 
-            # Get candlesticks
-            try:
-                candlesticks = self.market.get_candlesticks(
-                    position.symbol,
-                    self.config.candlestick_resolution
-                )
-            except NoDataException:
-                self.logger.warning("{} - {}: No candlesticks returned".format(
-                    self.market.name, position.symbol.name
-                ))
-                continue
-            except Exception:
-                self.logger.exception("{} - Unable to get candlesticks for symbol {}".format(
-                    self.market.name, position.symbol
-                ))
+        # Get candlesticks concurrently, then analyze positions one by one
+        symbol_candlesticks = self._get_candlesticks(
+            [position.symbol for position in candidates]
+        )
+        for position in candidates:
+            candlesticks = symbol_candlesticks[position.symbol.name]
+            if (candlesticks is None):
                 continue
 
             if (len(candlesticks) < 5):
-                self.logger.info("{}: Less than 5 candlesticks found, skipping analysis".format(
-                    position.symbol.name
-                ))
+                self.logger.info(
+                    "%s: Less than 5 candlesticks found, skipping analysis", position.symbol.name
+                )
                 continue
 
             # Analyze candlesticks for trends
             results = patterns.analyze_candlesticks(candlesticks)
-            avg_indication = sum([pattern.indication for pattern in results]) / len(results)
+            avg_indication = sum(pattern.indication for pattern in results) / len(results)
 
             # Determine if position should be closed, continue if no patterns detected
             if (avg_indication == 0):
-                self.logger.info("{}: No candlestick patterns detected".format(position.symbol.name))
+                self.logger.info("%s: No candlestick patterns detected", position.symbol.name)
+                continue
+            if (avg_indication > 0):
+                self.logger.info(
+                    "%s: Positive average indication value: %s, no sell",
+                    position.symbol.name, round(avg_indication, 2)
+                )
                 continue
 
             # Print recognized patterns along with average indicator
             self.log_new_patterns(position.symbol.name, avg_indication, results)
 
-            # Sell if trend indication value is positive
-            if (avg_indication < 0):
-                self.place_market_sell_order(position)
+            # Sell if trend indication value is negative
+            self.place_market_sell_order(position)
         return positions
 
     def remove_closed_exchange_positions(self, positions: List[Position]) -> None:
         """Removes positions from given list if position exchange is closed for trading."""
-        logged_exchanges = set()
-        for exchange_code, exchange_symbols in vars(self.config.exchanges).items():
+        # Collect configured symbols of closed exchanges, then filter positions once
+        closed_symbols = set()
+        for exchange_code, exchange_symbols in self._exchanges.items():
             try:
-                exchange = Exchange(exchange_code)
+                if (self._is_exchange_open(exchange_code)):
+                    continue
             except UnknownExchange:
-                self.logger.error("Unknown exchange code: {}".format(exchange_code))
+                self.logger.error("Unknown exchange code: %s", exchange_code)
                 continue
-            for i, position in reversed(list(enumerate(positions))):
-                if (position.symbol.name in exchange_symbols and not exchange.is_open()):
-                    positions.pop(i)
-                    if (exchange_code not in logged_exchanges):
-                        self.logger.info("Exchange {} is closed, skipping related symbols".format(
-                            exchange_code
-                        ))
-                        logged_exchanges.add(exchange_code)
+            self.logger.info("Exchange %s is closed, skipping related symbols", exchange_code)
+            closed_symbols.update(exchange_symbols)
+        if (closed_symbols):
+            positions[:] = [
+                position for position in positions
+                if (position.symbol.name not in closed_symbols)
+            ]
         return
 
     def remove_non_configured_positions(self, positions: List[Position]) -> None:
         """Removes positions from given list if symbol not configured for trading."""
         trader_symbols = self.get_symbol_names()
-        for i, position in reversed(list(enumerate(positions))):
-            if (position.symbol.name not in trader_symbols):
-                positions.pop(i)
+        positions[:] = [
+            position for position in positions
+            if (position.symbol.name in trader_symbols)
+        ]
         return
 
-    def check_market_for_potential_buy_candidates(self) -> None:
+    def check_market_for_potential_buy_candidates(
+            self, positions: Optional[List[Position]] = None
+    ) -> None:
         """
         Gets lists of defined/random symbols for configured exchanges,
         analyses candlesticks for positive trend patterns and tries to buy
         low.
+
+        :param positions: optional open positions already fetched this
+            trading run, fetched from broker if not given
+        :type positions: list of ztock.broker.Position
         """
         self.logger.info("Analyzing market for buy candidates")
 
         # Get configured symbols to check symbols for patterns, along with open positions
         symbols = self.get_symbols()
-        positions = self.broker.get_positions()
+        if (positions is None):
+            positions = self.broker.get_positions()
         position_sums = {}
         for position in positions:
             position_sum = position_sums.get(position.symbol.name, None)
             if (position_sum is None):
-                position_sums[position.symbol.name] = position
+                # Sum market values on a copy, positions may be shared
+                position_sums[position.symbol.name] = copy.copy(position)
             else:
                 position_sum.market_value += position.market_value
 
-        for symbol in symbols:
-            self.logger.debug("Analyzing {}".format(symbol))
+        # Max open position value, depends on broker balance
+        min_buy_amount = getattr(self.config, "min_buy_amount", 0)
+        max_position_multiplier = getattr(self.config, "max_position_value", 0)
+        buy_amount = self.broker.cash_balance * self.config.buy_fraction
+        max_position_value = max(buy_amount, min_buy_amount) * max_position_multiplier
+        bought = False
+
+        # Skip symbols where existing open positions exceed configured max
+        # before fetching any candlesticks
+        symbols = [
+            symbol for symbol in symbols
+            if (not self._exceeds_max_position_value(
+                position_sums.get(symbol.name, None), max_position_value
+            ))
+        ]
 
-            # If existing open positions exceed configured max, skip symbol
-            buy_amount = self.broker.cash_balance * self.config.buy_fraction
-            min_buy_amount = getattr(self.config, "min_buy_amount", 0)
-            max_position_multiplier = getattr(self.config, "max_position_value", 0)
-            max_position_value = max(buy_amount, min_buy_amount) * max_position_multiplier
-            if (symbol.name in position_sums and max_position_value > 0):
-                position = position_sums[symbol.name]
-                if (position.exchange_rate):
-                    market_value = position.market_value * position.exchange_rate
-                else:
-                    market_value = convert_currency(
-                        position.market_value,
-                        position.currency,
-                        self.broker.currency
-                    )
-                if (market_value and market_value > max_position_value):
-                    self.logger.info(
-                        "{0}: Skipping symbol, open position's market value "
-                        "exceeds configured max amount ({1:.2f} {2} > {3:.2f} {2})".format(
-                            position.symbol.name, market_value,
-                            self.broker.currency, max_position_value
-                        )
-                    )
-                    continue
+        # Get candlesticks concurrently. Analysis and orders are kept
+        # sequential, since orders change the broker balance
+        symbol_candlesticks = self._get_candlesticks(symbols)
+        for symbol in symbols:
+            self.logger.debug("Analyzing %s", symbol)
 
-            # Get candlesticks
-            try:
-                candlesticks = self.market.get_candlesticks(
-                    symbol,
-                    self.config.candlestick_resolution
-                )
-            except NoDataException:
-                self.logger.warning("{}: No candlesticks returned".format(symbol.name))
+            # Max position value may have decreased after previous buy orders
+            if (bought and self._exceeds_max_position_value(
+                    position_sums.get(symbol.name, None), max_position_value
+            )):
                 continue
-            except Exception:
-                self.logger.exception("Unable to get candlesticks for symbol {}".format(symbol))
+
+            candlesticks = symbol_candlesticks[symbol.name]
+            if (candlesticks is None):
                 continue
 
             if (len(candlesticks) < 5):
                 self.logger.info(
-                    "{}: Less than 5 candlesticks found, skipping analysis".format(symbol.name)
+                    "%s: Less than 5 candlesticks found, skipping analysis", symbol.name
                 )
                 continue
 
             # Analyze candlesticks for trends
             results = patterns.analyze_candlesticks(candlesticks)
-            avg_indication = sum([pattern.indication for pattern in results]) / len(results)
+            avg_indication = sum(pattern.indication for pattern in results) / len(results)
 
             # Determine if potential buy, continue if no patterns detected
             if (avg_indication == 0):
-                self.logger.info("{}: no patterns".format(symbol.name))
+                self.logger.info("%s: no patterns", symbol.name)
                 continue
 
             # Print recognized patterns
@@ -495,10 +506,126 @@ class Trader:
             # Buy if trend indication value is positive
             if (avg_indication > 0):
                 self.place_market_buy_order(symbol)
-                # Refresh broker ledger
+                # Refresh broker ledger and balance dependent max position value
                 self.broker.refresh()
+                bought = True
+                buy_amount = self.broker.cash_balance * self.config.buy_fraction
+                max_position_value = max(buy_amount, min_buy_amount) * max_position_multiplier
         return
 
+    def _list_exchange_symbols(self, exchange_code: str) -> Optional[Mapping[str, Symbol]]:
+        """
+        Returns common stock symbols for exchange, keyed by symbol name.
+        Symbol lists are fetched from market at most once a day.
+
+        :param exchange_code: exchange code
+        :type exchange_code: str
+        :return: exchange symbols, or None if market does not support listing
+        :rtype: mapping of (str, ztock.Symbol)
+        """
+        today = datetime.date.today()
+        cached = self._exchange_symbols.get(exchange_code, None)
+        if (cached is not None and cached[0] == today):
+            return cached[1]
+        try:
+            exchange_symbols = self.market.list_symbols(exchange_code, "Common Stock")
+        except NotImplementedError:
+            # Market data vendor does not supply symbol list. Symbol classes
+            # are generated per user symbol instead
+            exchange_symbols = None
+        self._exchange_symbols[exchange_code] = (today, exchange_symbols)
+        return exchange_symbols
+
+    def _is_exchange_open(self, exchange_code: str) -> bool:
+        """
+        Returns flag for if exchange is open for trading. Status is cached
+        for the rest of the trading run.
+
+        :param exchange_code: exchange code
+        :type exchange_code: str
+        :return: exchange open flag
+        :rtype: bool
+        :raises ztock.exceptions.UnknownExchange: if exchange opening hours are unknown
+        """
+        is_open = self._open_exchanges.get(exchange_code, None)
+        if (is_open is None):
+            is_open = get_exchange(exchange_code).is_open()
+            self._open_exchanges[exchange_code] = is_open
+        return is_open
+
+    def _exceeds_max_position_value(
+            self, position: Optional[Position], max_position_value: Decimal
+    ) -> bool:
+        """
+        Checks if an open position's market value exceeds configured max
+        position value, logging any skip.
+
+        :param position: summed open position for symbol, if any
+        :type position: ztock.broker.Position
+        :param max_position_value: max position value in broker currency
+        :type max_position_value: decimal.Decimal
+        :return: flag indicating if symbol should be skipped
+        :rtype: bool
+        """
+        if (position is None or max_position_value <= 0):
+            return False
+        if (position.exchange_rate):
+            market_value = position.market_value * position.exchange_rate
+        else:
+            market_value = convert_currency(
+                position.market_value,
+                position.currency,
+                self.broker.currency
+            )
+        if (market_value and market_value > max_position_value):
+            self.logger.info(
+                "%s: Skipping symbol, open position's market value "
+                "exceeds configured max amount (%.2f %s > %.2f %s)",
+                position.symbol.name, market_value, self.broker.currency,
+                max_position_value, self.broker.currency
+            )
+            return True
+        return False
+
+    def _get_candlesticks(
+            self, symbols: List[Symbol]
+    ) -> Dict[str, Optional[CandlestickSeries]]:
+        """
+        Fetches candlesticks for multiple symbols concurrently using
+        configured resolution, converted to series ready for pattern
+        analysis. Errors are logged, returning None instead of candlesticks.
+
+        :param symbols: symbols to get candlesticks for
+        :type symbols: list of ztock.Symbol
+        :return: candlesticks per symbol name, or None if unavailable
+        :rtype: dict of (str, ztock.candlestick.CandlestickSeries)
+        """
+        max_workers = getattr(self.config, "max_fetch_workers", None) or self.max_fetch_workers
+        results = self.market.get_candlesticks_batch(
+            symbols,
+            self.config.candlestick_resolution,
+            max_workers=max_workers,
+            return_exceptions=True
+        )
+        symbol_candlesticks = {}
+        for symbol in symbols:
+            candlesticks = results[symbol.name]
+            if (isinstance(candlesticks, NoDataException)):
+                self.logger.warning(
+                    "%s - %s: No candlesticks returned", self.market.name, symbol.name
+                )
+                candlesticks = None
+            elif (isinstance(candlesticks, Exception)):
+                self.logger.error(
+                    "%s - Unable to get candlesticks for symbol %s", self.market.name, symbol,
+                    exc_info=candlesticks
+                )
+                candlesticks = None
+            else:
+                candlesticks = CandlestickSeries.from_candlesticks(candlesticks)
+            symbol_candlesticks[symbol.name] = candlesticks
+        return symbol_candlesticks
+
     def calculate_next_run(self) -> datetime.datetime:
         """
         Calculates when to run the trader again based on configured wait period.
@@ -506,17 +633,13 @@ class Trader:
         :return: datetime for next run
         :rtype: datetime.datetime
         """
-        wait = datetime.timedelta(seconds=self.config.sleep_duration)
-        next_run = datetime.datetime.now() + wait
-        # Round next run to sleep duration interval + market vendor delay
-        # (to allow candlestick intervals to update)
-        next_run -= datetime.timedelta(
-            minutes=next_run.minute % (self.config.sleep_duration / 60),
-            seconds=next_run.second,
-            microseconds=next_run.microsecond
-        )
-        interval_delay = getattr(self.market.config, "interval_delay", 0)
-        next_run += datetime.timedelta(interval_delay)
+        # Round next run to the next sleep duration interval + market vendor
+        # delay in seconds (to allow candlestick intervals to update)
+        step = int(self.config.sleep_duration)
+        timestamp = int(time.time())
+        aligned_timestamp = (timestamp // step + 1) * step
+        interval_delay = int(getattr(self.market.config, "interval_delay", 0))
+        next_run = datetime.datetime.fromtimestamp(aligned_timestamp + interval_delay)
         return next_run
 
     def _log_order(self, msg: str) -> None:
@@ -536,9 +659,12 @@ class Trader:
         Performs a trading run.
         """
         self.next_run = None
-        self.logger.info("{} {} - Starting trading run ----------------------------------".format(
+        # Exchanges may have opened or closed since last run
+        self._open_exchanges = {}
+        self.logger.info(
+            "%s %s - Starting trading run ----------------------------------",
             self.broker.name, self.id
-        ))
+        )
 
         # Refresh market vendor connection
         self.market.refresh()
@@ -554,12 +680,13 @@ class Trader:
 
         # Get/validate live orders
         live_orders = self.broker.get_live_orders()
-        self.logger.debug("Live orders: {}".format(live_orders))
+        self.logger.debug("Live orders: %s", live_orders)
         self.broker.cancel_stale_orders(live_orders, self.config.order_lifetime)
 
         # Check positions for negative trends to potentially close trades
+        positions = None
         if (getattr(self.config, "sell", True)):
-            self.check_positions_for_sell_candidates()
+            positions = self.check_positions_for_sell_candidates()
 
         # Check defined/random exchange symbols for positive trends to potentially buy
         if (getattr(self.config, "buy", True)):
@@ -568,15 +695,15 @@ class Trader:
             if (self.broker.cash_balance > min_buy_amount + min_broker_balance):
                 # Refresh broker ledger
                 self.broker.refresh()
-                self.check_market_for_potential_buy_candidates()
+                self.check_market_for_potential_buy_candidates(positions)
             else:
+                currency = self.broker.currency
                 self.logger.info(
                     "Available broker cash balance less than configured minimum "
                     "buy order amount, skipping analysis of potential buy "
-                    "candidates ({0:.2f} {1} < {2:.2f} {1} + {3:.2f}) {1}".format(
-                        self.broker.cash_balance, self.broker.currency,
-                        min_buy_amount, min_broker_balance
-                    )
+                    "candidates (%.2f %s < %.2f %s + %.2f %s)",
+                    self.broker.cash_balance, currency, min_buy_amount, currency,
+                    min_broker_balance, currency
                 )
 
         # Calculate next run time
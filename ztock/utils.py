@@ -2,31 +2,41 @@
 """
 ztock utility functions.
 """
+import base64
+import os
 import random
-import secrets
-import string
 from decimal import Decimal, ROUND_HALF_UP
-from typing import Dict, List, Union
+from typing import Any, List, Mapping, Union
+
+import requests
 
 from .symbol import Symbol
 
+# Use orjson for faster JSON decoding if installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-# TODO: delete?
-def seconds_to_days(seconds: Union[Decimal, float]) -> Decimal:
-    """Converts seconds to days."""
-    if (isinstance(seconds, float)):
-        seconds = Decimal(seconds)
-    return seconds / parse_decimal(60.0) / parse_decimal(60.0) / parse_decimal(24.0)
+# Decimal places used by parse_decimal()
+_QUANTUM = Decimal(".000001")
 
 
 def parse_decimal(number: Union[int, float, str]) -> Decimal:
     """Converts number to decimal with defined number of decimal places."""
-    return Decimal(Decimal(number).quantize(Decimal('.000001'), rounding=ROUND_HALF_UP))
+    return Decimal(number).quantize(_QUANTUM, rounding=ROUND_HALF_UP)
+
+
+def load_json(response: requests.Response) -> Any:
+    """Decodes JSON response body, using orjson if installed."""
+    if (orjson is None):
+        return response.json()
+    return orjson.loads(response.content)
 
 
 def pick_random_symbols(
         count: int,
-        exchange_symbols: Dict[str, Symbol],
+        exchange_symbols: Mapping[str, Symbol],
         user_symbols: List[str]
 ) -> List[Symbol]:
     """
@@ -35,40 +45,45 @@ def pick_random_symbols(
 
     :param count: number of symbols to pick
     :type count: int
-    :param exchange_symbols: all exchange symbols
-    :type exchange_symbols: dict of (str, ztock.Symbol)
+    :param exchange_symbols: all exchange symbols, keyed by symbol name
+    :type exchange_symbols: mapping of (str, ztock.Symbol)
     :param user_symbols: already selected user symbols to avoid
     :type user_symbols: list of str
     :return: randomly selected symbols
     :rtype: list of ztock.Symbol
     """
-    symbol_pool = [
-        exchange_symbol
-        for exchange_symbol in exchange_symbols.values()
-        if (exchange_symbol.name not in user_symbols)
+    # Pick from symbol names, only picked symbols are looked up
+    excluded = set(user_symbols)
+    name_pool = [
+        symbol_name
+        for symbol_name in exchange_symbols
+        if (symbol_name not in excluded)
     ]
-    if (len(symbol_pool) == 0):
+    if (len(name_pool) == 0):
         return []
-    if (count > len(symbol_pool)):
-        count = len(symbol_pool)
-    random_symbols = random.sample([symbol for symbol in symbol_pool], count)
+    if (count > len(name_pool)):
+        count = len(name_pool)
+    random_symbols = [
+        exchange_symbols[symbol_name] for symbol_name in random.sample(name_pool, count)
+    ]
     return random_symbols
 
 
 def generate_random_string(string_length: int = 12) -> str:
-    """Generates a random string, for example for OAuth2 state parameter."""
-    random_string = ''.join(
-        secrets.choice(string.ascii_uppercase + string.digits)
-        for _ in range(string_length)
-    )
+    """
+    Generates a random string of uppercase letters and digits 2-7, for
+    example for OAuth2 state parameter.
+    """
+    # Base32 encodes every 5 random bytes as 8 characters
+    n_bytes = (string_length * 5 + 7) // 8
+    random_string = base64.b32encode(os.urandom(n_bytes)).decode("ascii")[:string_length]
     return random_string
 
 
 def pprint_number(number):
     """Returns pretty decimal representation of number with trailing 0's stripped."""
     string = str(number)
-    if ("." in string):
-        integer, decimal = string.split(".")
-        decimal = decimal.rstrip("0")
-        string = f"{integer}.{decimal}"
-    return string
+    # Leave integers and exponent notation as is
+    if ("." not in string or "e" in string or "E" in string):
+        return string
+    return string.rstrip("0").rstrip(".")